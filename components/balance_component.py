@@ -0,0 +1,22 @@
+"""Composant d'équilibre du cycliste."""
+
+from core.entity import IComponent
+
+
+class BalanceComponent(IComponent):
+    """Équilibre latéral dans [-1, 1] (négatif à gauche) ; revient vers
+    le neutre, perturbé par le dévers et la rugosité du terrain."""
+
+    def __init__(self, stability: float = 2.0):
+        super().__init__()
+        self.current_balance = 0.0
+        # Vitesse de retour au neutre (1/s).
+        self.stability = stability
+
+    def apply_disturbance(self, amount: float) -> None:
+        self.current_balance = min(
+            1.0, max(-1.0, self.current_balance + amount))
+
+    def update(self, delta_time: float) -> None:
+        self.current_balance -= (self.current_balance * self.stability
+                                 * delta_time)
@@ -0,0 +1,38 @@
+"""Composant physique : position, vitesse et forces."""
+
+from core.entity import IComponent
+from utils.vector2 import Vector2
+
+
+class PhysicsComponent(IComponent):
+    """Intégration physique simple (Euler explicite)."""
+
+    def __init__(self, mass: float = 1.0, friction: float = 0.95):
+        super().__init__()
+        self.position = Vector2()
+        self.velocity = Vector2()
+        self.acceleration = Vector2()
+        self.mass = mass
+        self.friction = friction
+        self.speed_multiplier = 1.0
+
+    def apply_force(self, force: Vector2) -> None:
+        """Accumule une force pour la prochaine intégration."""
+        self.acceleration.add_scaled(force, 1.0 / self.mass)
+
+    def stop(self) -> None:
+        """Annule tout mouvement en cours."""
+        self.velocity = Vector2()
+        self.acceleration = Vector2()
+
+    def update(self, delta_time: float) -> None:
+        # Intégration entièrement en place (add_scaled / *=) : zéro
+        # vecteur transitoire par entité et par frame.
+        velocity = self.velocity
+        velocity.add_scaled(self.acceleration, delta_time)
+        velocity *= self.friction
+        self.position.add_scaled(
+            velocity, delta_time * self.speed_multiplier)
+        acceleration = self.acceleration
+        acceleration.x = 0.0
+        acceleration.y = 0.0
@@ -0,0 +1,31 @@
+"""Composant d'affichage : surface pygame et calque de rendu."""
+
+from typing import Optional
+
+import pygame
+
+from core.entity import IComponent
+from utils.vector2 import Vector2
+
+
+class SpriteComponent(IComponent):
+    """Porte la surface à blitter pour une entité."""
+
+    def __init__(self, surface: Optional[pygame.Surface] = None, layer: int = 0):
+        super().__init__()
+        self.surface = surface
+        self.offset = Vector2()
+        self.layer = layer
+        self.visible = True
+
+    def update(self, delta_time: float) -> None:
+        pass
+
+    def render(self, screen: pygame.Surface, position: Vector2,
+               camera_offset: Vector2) -> None:
+        if not self.visible or self.surface is None:
+            return
+        screen.blit(self.surface, (
+            int(position.x + self.offset.x - camera_offset.x),
+            int(position.y + self.offset.y - camera_offset.y),
+        ))
@@ -0,0 +1,35 @@
+"""Composant d'endurance du cycliste."""
+
+from core.entity import IComponent
+
+
+class StaminaComponent(IComponent):
+    """Réserve d'endurance, drainée par l'effort et le terrain."""
+
+    def __init__(self, max_stamina: float = 100.0,
+                 recovery_rate: float = 4.0):
+        super().__init__()
+        self.max_stamina = max_stamina
+        self.current_stamina = max_stamina
+        self.recovery_rate = recovery_rate
+        # Drain instantané (unités/s), fixé par la physique selon le
+        # terrain et l'effort.
+        self.drain_rate = 0.0
+        self.fatigue_level = 0.0
+
+    @property
+    def zone(self) -> str:
+        """Zone d'effort courante : verte, orange ou rouge."""
+        ratio = self.current_stamina / self.max_stamina
+        if ratio > 0.6:
+            return "verte"
+        if ratio > 0.25:
+            return "orange"
+        return "rouge"
+
+    def update(self, delta_time: float) -> None:
+        net = self.recovery_rate - self.drain_rate
+        self.current_stamina = min(
+            self.max_stamina,
+            max(0.0, self.current_stamina + net * delta_time))
+        self.fatigue_level = 1.0 - self.current_stamina / self.max_stamina
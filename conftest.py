@@ -0,0 +1,25 @@
+"""Fixtures partagées : pygame est initialisé une seule fois par session
+(chaque pygame.init() coûte des dizaines de millisecondes de démarrage
+SDL), et les petites surfaces de test sont réutilisées."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session")
+def pg():
+    """Session pygame partagée par tous les tests."""
+    pygame.init()
+    yield pygame
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def small_surface(pg):
+    """Surface 10×10 partagée ; les tests qui ont besoin d'une copie
+    privée font surface.copy()."""
+    return pygame.Surface((10, 10))
@@ -0,0 +1,76 @@
+"""Patron Commande : entrées clavier découplées des actions du cycliste."""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import pygame
+
+from core.state_machine import StateType
+from utils.vector2 import Vector2
+
+
+class ICommand(ABC):
+    """Action exécutable sur un cycliste."""
+
+    @abstractmethod
+    def execute(self, cyclist) -> None:
+        ...
+
+
+class AccelerateCommand(ICommand):
+    """Applique une poussée vers l'avant."""
+
+    def __init__(self, force: float = 400.0):
+        self.force = force
+
+    def execute(self, cyclist) -> None:
+        cyclist.physics.apply_force(Vector2(self.force, 0.0))
+
+
+class BrakeCommand(ICommand):
+    """Freine en amortissant la vitesse courante."""
+
+    def __init__(self, braking: float = 0.5):
+        self.braking = braking
+
+    def execute(self, cyclist) -> None:
+        cyclist.physics.velocity = cyclist.physics.velocity * self.braking
+
+
+class ToggleCarryCommand(ICommand):
+    """Passe du roulage au portage et inversement."""
+
+    def execute(self, cyclist) -> None:
+        machine = cyclist.state_machine
+        if machine.current_state_type == StateType.RIDING:
+            machine.change_state(StateType.CARRYING)
+        elif machine.current_state_type == StateType.CARRYING:
+            machine.change_state(StateType.REMOUNTING)
+
+
+class CrashCommand(ICommand):
+    """Force une chute (collisions, debug)."""
+
+    def execute(self, cyclist) -> None:
+        cyclist.state_machine.change_state(StateType.CRASHED)
+
+
+class InputHandler:
+    """Associe les touches aux commandes (remappable)."""
+
+    def __init__(self):
+        self.bindings: Dict[int, ICommand] = {
+            pygame.K_UP: AccelerateCommand(),
+            pygame.K_DOWN: BrakeCommand(),
+            pygame.K_SPACE: ToggleCarryCommand(),
+            pygame.K_x: CrashCommand(),
+        }
+
+    def bind(self, key: int, command: ICommand) -> None:
+        self.bindings[key] = command
+
+    def handle_event(self, event: pygame.event.Event) -> Optional[ICommand]:
+        """Retourne la commande liée à un KEYDOWN, sans l'exécuter."""
+        if event.type == pygame.KEYDOWN:
+            return self.bindings.get(event.key)
+        return None
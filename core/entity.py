@@ -0,0 +1,87 @@
+"""Entité de base du jeu et interface des composants."""
+
+from abc import ABC, abstractmethod
+from enum import IntEnum
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+
+class Tag(IntEnum):
+    """Vocabulaire fermé des tags d'entités.
+
+    Des identifiants entiers : l'index par tag est une liste indexée par
+    Tag.value, sans hachage de chaînes."""
+    CYCLIST = 0
+    OBSTACLE = 1
+    PICKUP = 2
+    CHECKPOINT = 3
+    SPECTATOR = 4
+
+
+class IComponent(ABC):
+    """Interface commune à tous les composants d'entité."""
+
+    def __init__(self):
+        self.owner: Optional['Entity'] = None
+
+    @abstractmethod
+    def update(self, delta_time: float) -> None:
+        """Met à jour le composant."""
+        ...
+
+
+class Entity:
+    """Entité générique : un identifiant, des tags et des composants."""
+
+    _next_id = 1
+
+    def __init__(self, name: str = "", tags: Optional[Sequence[Tag]] = None):
+        self.id = Entity._next_id
+        Entity._next_id += 1
+        self.name = name or f"entity_{self.id}"
+        self.tags: Tuple[Tag, ...] = tuple(tags) if tags else ()
+        self.active = True
+        # Les entités statiques (attente d'entrée, décor) mettent ce
+        # drapeau à False et sont ignorées par EntityManager.update
+        # jusqu'à ce qu'un événement le réarme.
+        self.needs_update = True
+        self._components: Dict[Type[IComponent], IComponent] = {}
+        # Renseigné par EntityManager.add_entity pour tenir l'index
+        # par composant à jour.
+        self._manager = None
+
+    def add_component(self, component: IComponent) -> IComponent:
+        """Attache un composant à l'entité."""
+        component_type = type(component)
+        component.owner = self
+        self._components[component_type] = component
+        if self._manager is not None:
+            self._manager._register_component(self, component_type)
+        return component
+
+    def remove_component(self, component_type: Type[IComponent]) -> None:
+        """Détache un composant de l'entité."""
+        component = self._components.pop(component_type, None)
+        if component is not None:
+            component.owner = None
+            if self._manager is not None:
+                self._manager._unregister_component(self, component_type)
+
+    def get_component(self, component_type: Type[IComponent]) -> Optional[IComponent]:
+        return self._components.get(component_type)
+
+    def has_component(self, component_type: Type[IComponent]) -> bool:
+        return component_type in self._components
+
+    def update(self, delta_time: float) -> None:
+        """Met à jour tous les composants de l'entité."""
+        if not self.active:
+            return
+        for component in self._components.values():
+            component.update(delta_time)
+
+    def destroy(self) -> None:
+        """Libère l'entité et ses composants."""
+        for component in self._components.values():
+            component.owner = None
+        self._components.clear()
+        self.active = False
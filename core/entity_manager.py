@@ -0,0 +1,117 @@
+"""Gestionnaire central des entités du jeu (Singleton)."""
+
+from typing import Dict, List, Optional, Set, Type
+
+from core.entity import Entity, IComponent, Tag
+
+
+class EntityManager:
+    """Tient le registre des entités et les index par id, type, tag et
+    composant pour éviter les parcours linéaires dans les systèmes."""
+
+    _instance: Optional['EntityManager'] = None
+
+    @classmethod
+    def instance(cls) -> 'EntityManager':
+        """Instance partagée, sans repasser par __new__/__init__ et leur
+        garde à chaque accès. Préférer l'import du module-level
+        `entity_manager` sur les chemins chauds."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self._entities: List[Entity] = []
+        self._entities_by_id: Dict[int, Entity] = {}
+        self._entities_by_type: Dict[type, List[Entity]] = {}
+        self._entities_by_tag: List[List[Entity]] = [[] for _ in Tag]
+        self._entities_by_component: Dict[Type[IComponent], Set[Entity]] = {}
+
+    def add_entity(self, entity: Entity) -> Entity:
+        """Enregistre une entité et l'insère dans tous les index."""
+        self._entities.append(entity)
+        self._entities_by_id[entity.id] = entity
+        self._entities_by_type.setdefault(type(entity), []).append(entity)
+        for tag in entity.tags:
+            self._entities_by_tag[tag].append(entity)
+        entity._manager = self
+        for component_type in entity._components:
+            self._register_component(entity, component_type)
+        return entity
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Retire une entité de tous les index et la détruit."""
+        if entity.id not in self._entities_by_id:
+            return
+        self._entities.remove(entity)
+        del self._entities_by_id[entity.id]
+        by_type = self._entities_by_type.get(type(entity))
+        if by_type is not None:
+            by_type.remove(entity)
+        for tag in entity.tags:
+            self._entities_by_tag[tag].remove(entity)
+        for component_type in entity._components:
+            self._unregister_component(entity, component_type)
+        entity._manager = None
+        entity.destroy()
+
+    def _register_component(self, entity: Entity,
+                            component_type: Type[IComponent]) -> None:
+        """Maintient l'index entités-par-composant (appelé par Entity)."""
+        self._entities_by_component.setdefault(component_type, set()).add(entity)
+
+    def _unregister_component(self, entity: Entity,
+                              component_type: Type[IComponent]) -> None:
+        bucket = self._entities_by_component.get(component_type)
+        if bucket is not None:
+            bucket.discard(entity)
+
+    def get_entity_by_id(self, entity_id: int) -> Optional[Entity]:
+        return self._entities_by_id.get(entity_id)
+
+    def get_entities_by_type(self, entity_type: type) -> List[Entity]:
+        return self._entities_by_type.get(entity_type, [])
+
+    def get_entities_by_tag(self, tag: Tag) -> List[Entity]:
+        return self._entities_by_tag[tag]
+
+    def get_entities_with_component(
+            self, component_type: Type[IComponent]) -> List[Entity]:
+        """Entités possédant le composant, via l'index incrémental
+        (lecture O(1) au lieu d'un parcours de toutes les entités)."""
+        bucket = self._entities_by_component.get(component_type)
+        return list(bucket) if bucket else []
+
+    def update(self, delta_time: float) -> None:
+        """Met à jour toutes les entités actives, groupées par type.
+
+        Itérer type par type garde le cache de méthodes de CPython chaud
+        et permet de résoudre update une seule fois par groupe."""
+        for entity_type, entities in self._entities_by_type.items():
+            update_fn = entity_type.update
+            for entity in entities:
+                if entity.needs_update:
+                    update_fn(entity, delta_time)
+
+    def clear(self) -> None:
+        """Supprime toutes les entités (changement de scène).
+
+        Détruit chaque entité puis vide les conteneurs en bloc, sans
+        passer par la chirurgie d'index de remove_entity."""
+        for entity in self._entities:
+            entity._manager = None
+            entity.destroy()
+        self._entities.clear()
+        self._entities_by_id.clear()
+        self._entities_by_type.clear()
+        for bucket in self._entities_by_tag:
+            bucket.clear()
+        self._entities_by_component.clear()
+
+    @property
+    def count(self) -> int:
+        return len(self._entities)
+
+
+# Instance partagée du jeu : un import direct évite tout appel par frame.
+entity_manager = EntityManager.instance()
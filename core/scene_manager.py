@@ -0,0 +1,95 @@
+"""Scènes du jeu (menu, course, résultats) et leur gestionnaire."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+import pygame
+
+
+class Scene(ABC):
+    """Scène de base : une scène demande son changement au gestionnaire
+    via scene_manager.request_transition plutôt que d'exposer un attribut
+    que le gestionnaire devrait sonder à chaque frame."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.scene_manager: Optional['SceneManager'] = None
+
+    def on_enter(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """Appelé à l'activation de la scène."""
+        pass
+
+    def on_exit(self) -> None:
+        """Appelé à la désactivation de la scène."""
+        pass
+
+    def is_dirty(self) -> bool:
+        """Vrai si la scène a du travail par frame. Les scènes statiques
+        (menus, pauses) renvoient False pour que le gestionnaire saute
+        entièrement leur update en l'absence d'événement."""
+        return True
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, delta_time: float) -> None:
+        ...
+
+    @abstractmethod
+    def render(self, screen: pygame.Surface) -> None:
+        ...
+
+
+class SceneManager:
+    """Active une scène à la fois ; les transitions sont explicites."""
+
+    def __init__(self):
+        self._scenes: Dict[str, Scene] = {}
+        self._current_scene: Optional[Scene] = None
+        # Transition demandée par la scène courante, consommée en fin de
+        # frame. Un seul test local dans update, pas de chaîne
+        # d'attributs dans la scène.
+        self._pending_next: Optional[Tuple[str, Optional[Dict]]] = None
+        self._had_event = False
+
+    @property
+    def current_scene(self) -> Optional[Scene]:
+        return self._current_scene
+
+    def add_scene(self, scene: Scene) -> None:
+        scene.scene_manager = self
+        self._scenes[scene.name] = scene
+
+    def request_transition(self, name: str,
+                           data: Optional[Dict[str, Any]] = None) -> None:
+        """Demande un changement de scène pour la fin de la frame."""
+        self._pending_next = (name, data)
+
+    def change_scene(self, name: str,
+                     data: Optional[Dict[str, Any]] = None) -> None:
+        """Change de scène immédiatement."""
+        scene = self._scenes[name]
+        if self._current_scene is not None:
+            self._current_scene.on_exit()
+        self._current_scene = scene
+        scene.on_enter(data)
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        self._had_event = True
+        if self._current_scene is not None:
+            self._current_scene.handle_event(event)
+
+    def update(self, delta_time: float) -> None:
+        scene = self._current_scene
+        if scene is not None and (self._had_event or scene.is_dirty()):
+            scene.update(delta_time)
+        self._had_event = False
+        if self._pending_next:
+            name, data = self._pending_next
+            self._pending_next = None
+            self.change_scene(name, data)
+
+    def render(self, screen: pygame.Surface) -> None:
+        if self._current_scene is not None:
+            self._current_scene.render(screen)
@@ -0,0 +1,103 @@
+"""Machine à états du cycliste, pilotée par table.
+
+Chaque état est une donnée (`CyclistState`) : des fonctions de module et
+l'ensemble des transitions autorisées. Pas de hiérarchie de classes ni de
+méthodes liées à allouer à chaque appel.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable, Dict, FrozenSet, List, Optional
+
+import pygame
+
+
+class StateType(Enum):
+    """États possibles du cycliste en course."""
+    RIDING = 0
+    CARRYING = 1
+    REMOUNTING = 2
+    CRASHED = 3
+
+
+def noop(cyclist, *args) -> None:
+    """Fonction partagée pour les slots d'état sans logique ; la machine
+    saute l'appel quand elle la reconnaît."""
+    pass
+
+
+@dataclass(frozen=True)
+class CyclistState:
+    """Description d'un état : fonctions de transition et de mise à jour."""
+    state_type: StateType
+    enter_fn: Callable = noop
+    exit_fn: Callable = noop
+    update_fn: Callable = noop
+    input_fn: Callable = noop
+    allowed_transitions: FrozenSet[StateType] = field(default_factory=frozenset)
+
+
+class StateMachine:
+    """Gère l'état courant et les transitions autorisées."""
+
+    N_STATES = len(StateType)
+
+    def __init__(self, owner):
+        self.owner = owner
+        self._states: Dict[StateType, CyclistState] = {}
+        self._current: Optional[CyclistState] = None
+        # Table plate des transitions autorisées, indexée
+        # [courant.value][nouveau.value] : deux indexations de liste par
+        # tentative, ni dispatch de méthode ni hachage de frozenset.
+        self._allowed: List[List[bool]] = [
+            [False] * self.N_STATES for _ in range(self.N_STATES)]
+
+    @property
+    def current_state(self) -> Optional[CyclistState]:
+        return self._current
+
+    @property
+    def current_state_type(self) -> Optional[StateType]:
+        return self._current.state_type if self._current else None
+
+    def add_state(self, state: CyclistState) -> None:
+        self._states[state.state_type] = state
+        row = self._allowed[state.state_type.value]
+        for target in state.allowed_transitions:
+            row[target.value] = True
+
+    def change_state(self, new_state_type: StateType) -> bool:
+        """Effectue la transition si elle est autorisée."""
+        new_state = self._states.get(new_state_type)
+        if new_state is None:
+            return False
+        current = self._current
+        if current is not None:
+            if current.state_type == new_state_type:
+                return False
+            if not self._allowed[current.state_type.value][new_state_type.value]:
+                return False
+            current.exit_fn(self.owner)
+        self._current = new_state
+        new_state.enter_fn(self.owner)
+        return True
+
+    def set_initial_state(self, state_type: StateType) -> None:
+        """Entre dans l'état initial sans vérifier de transition."""
+        state = self._states[state_type]
+        self._current = state
+        state.enter_fn(self.owner)
+
+    def update(self, delta_time: float) -> None:
+        current = self._current
+        if current is not None:
+            fn = current.update_fn
+            if fn is not noop:
+                fn(self.owner, delta_time)
+
+    def handle_input(self, event: pygame.event.Event) -> None:
+        current = self._current
+        if current is not None:
+            fn = current.input_fn
+            if fn is not noop:
+                fn(self.owner, event)
@@ -0,0 +1,47 @@
+"""Entité cycliste : physique, sprite, animations et machine à états."""
+
+from typing import Optional
+
+from components.physics_component import PhysicsComponent
+from components.sprite_component import SpriteComponent
+from core.entity import Entity, Tag
+from core.state_machine import StateMachine, StateType
+from entities.cyclist_states import ALL_STATES
+from graphics.animation_controller import (AnimationController,
+                                           NullAnimationController)
+
+
+class Cyclist(Entity):
+    """Cycliste jouable ou adverse.
+
+    `state_machine` et `animation_controller` sont toujours affectés dans
+    le constructeur : les états peuvent les utiliser directement sans
+    test `hasattr` préalable (contrôleur neutre en l'absence de sprites).
+    """
+
+    def __init__(self, name: str = "",
+                 animation_controller: Optional[AnimationController] = None):
+        super().__init__(name=name, tags=(Tag.CYCLIST,))
+        # Référence directe : les états y accèdent à chaque transition,
+        # sans repasser par le registre de composants.
+        self.physics = self.add_component(PhysicsComponent(mass=75.0))
+        self.add_component(SpriteComponent())
+
+        self.animation_controller = (animation_controller
+                                     or NullAnimationController())
+
+        # Les états sont des descripteurs partagés ; l'échéance des
+        # états temporisés vit sur le cycliste (_state_deadline).
+        self._state_deadline = 0.0
+        self.state_machine = StateMachine(self)
+        for state in ALL_STATES:
+            self.state_machine.add_state(state)
+        self.state_machine.set_initial_state(StateType.RIDING)
+
+    def update(self, delta_time: float) -> None:
+        super().update(delta_time)
+        self.state_machine.update(delta_time)
+        self.animation_controller.update(delta_time)
+
+    def handle_input(self, event) -> None:
+        self.state_machine.handle_input(event)
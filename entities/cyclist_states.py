@@ -0,0 +1,133 @@
+"""États du cycliste : rouler, porter, remonter, chuter.
+
+Les états sont des `CyclistState` construits à partir de fonctions de
+module ; les états temporisés (remontée, chute) posent une échéance
+d'horloge monotone sur le cycliste : une comparaison par frame, pas
+d'accumulation de flottants.
+"""
+
+import logging
+from time import perf_counter
+
+import pygame
+
+from core.state_machine import CyclistState, StateType
+
+logger = logging.getLogger(__name__)
+
+REMOUNT_DURATION = 0.8
+CRASH_DURATION = 1.5
+
+
+# --- RIDING ---------------------------------------------------------------
+
+def _riding_enter(cyclist) -> None:
+    logger.debug("%s : en selle", cyclist.name)
+    cyclist.physics.speed_multiplier = 1.0
+    cyclist.animation_controller.play('riding')
+
+
+def _riding_exit(cyclist) -> None:
+    logger.debug("%s : quitte la selle", cyclist.name)
+
+
+def _riding_input(cyclist, event: pygame.event.Event) -> None:
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_SPACE:
+            cyclist.state_machine.change_state(StateType.CARRYING)
+        elif event.key == pygame.K_x:
+            cyclist.state_machine.change_state(StateType.CRASHED)
+
+
+# --- CARRYING -------------------------------------------------------------
+
+def _carrying_enter(cyclist) -> None:
+    logger.debug("%s : portage du vélo", cyclist.name)
+    cyclist.physics.speed_multiplier = 0.5
+    cyclist.animation_controller.play('carrying')
+
+
+def _carrying_exit(cyclist) -> None:
+    logger.debug("%s : repose le vélo", cyclist.name)
+    cyclist.physics.speed_multiplier = 1.0
+
+
+def _carrying_input(cyclist, event: pygame.event.Event) -> None:
+    if event.type == pygame.KEYDOWN:
+        if event.key == pygame.K_SPACE:
+            cyclist.state_machine.change_state(StateType.REMOUNTING)
+        elif event.key == pygame.K_x:
+            cyclist.state_machine.change_state(StateType.CRASHED)
+
+
+# --- REMOUNTING -----------------------------------------------------------
+
+def _remounting_enter(cyclist) -> None:
+    logger.debug("%s : remonte en selle", cyclist.name)
+    cyclist._state_deadline = perf_counter() + REMOUNT_DURATION
+    cyclist.physics.speed_multiplier = 0.3
+    cyclist.animation_controller.play('remounting')
+
+
+def _remounting_exit(cyclist) -> None:
+    logger.debug("%s : de nouveau en selle", cyclist.name)
+
+
+def _remounting_update(cyclist, delta_time: float) -> None:
+    if perf_counter() >= cyclist._state_deadline:
+        cyclist.state_machine.change_state(StateType.RIDING)
+
+
+# --- CRASHED --------------------------------------------------------------
+
+def _crashed_enter(cyclist) -> None:
+    logger.debug("%s : chute !", cyclist.name)
+    cyclist._state_deadline = perf_counter() + CRASH_DURATION
+    cyclist.physics.stop()
+    cyclist.animation_controller.play('crashed')
+
+
+def _crashed_exit(cyclist) -> None:
+    logger.debug("%s : se relève", cyclist.name)
+
+
+def _crashed_update(cyclist, delta_time: float) -> None:
+    if perf_counter() >= cyclist._state_deadline:
+        cyclist.state_machine.change_state(StateType.REMOUNTING)
+
+
+# --- Table des états ------------------------------------------------------
+
+RIDING = CyclistState(
+    state_type=StateType.RIDING,
+    enter_fn=_riding_enter,
+    exit_fn=_riding_exit,
+    input_fn=_riding_input,
+    allowed_transitions=frozenset({StateType.CARRYING, StateType.CRASHED}),
+)
+
+CARRYING = CyclistState(
+    state_type=StateType.CARRYING,
+    enter_fn=_carrying_enter,
+    exit_fn=_carrying_exit,
+    input_fn=_carrying_input,
+    allowed_transitions=frozenset({StateType.REMOUNTING, StateType.CRASHED}),
+)
+
+REMOUNTING = CyclistState(
+    state_type=StateType.REMOUNTING,
+    enter_fn=_remounting_enter,
+    exit_fn=_remounting_exit,
+    update_fn=_remounting_update,
+    allowed_transitions=frozenset({StateType.RIDING, StateType.CRASHED}),
+)
+
+CRASHED = CyclistState(
+    state_type=StateType.CRASHED,
+    enter_fn=_crashed_enter,
+    exit_fn=_crashed_exit,
+    update_fn=_crashed_update,
+    allowed_transitions=frozenset({StateType.REMOUNTING}),
+)
+
+ALL_STATES = (RIDING, CARRYING, REMOUNTING, CRASHED)
@@ -0,0 +1,58 @@
+"""Contrôleur d'animation : séquences de frames nommées."""
+
+from typing import Dict, List, Optional
+
+import pygame
+
+
+class AnimationController:
+    """Joue des animations (listes de surfaces) à une cadence fixe."""
+
+    def __init__(self, frame_duration: float = 0.15):
+        self._animations: Dict[str, List[pygame.Surface]] = {}
+        self._current_name: Optional[str] = None
+        self._frame_index = 0
+        self._frame_duration = frame_duration
+        self._elapsed = 0.0
+
+    def add_animation(self, name: str, frames: List[pygame.Surface]) -> None:
+        self._animations[name] = frames
+
+    def has_animation(self, name: str) -> bool:
+        return name in self._animations
+
+    def play(self, name: str) -> None:
+        """Démarre l'animation nommée depuis sa première frame."""
+        if name != self._current_name and name in self._animations:
+            self._current_name = name
+            self._frame_index = 0
+            self._elapsed = 0.0
+
+    def update(self, delta_time: float) -> None:
+        if self._current_name is None:
+            return
+        self._elapsed += delta_time
+        if self._elapsed >= self._frame_duration:
+            self._elapsed -= self._frame_duration
+            frames = self._animations[self._current_name]
+            self._frame_index = (self._frame_index + 1) % len(frames)
+
+    @property
+    def current_frame(self) -> Optional[pygame.Surface]:
+        if self._current_name is None:
+            return None
+        return self._animations[self._current_name][self._frame_index]
+
+
+class NullAnimationController(AnimationController):
+    """Contrôleur neutre : permet d'appeler play/update sans test préalable
+    quand le cycliste n'a pas de sprites (tests, serveur headless)."""
+
+    def has_animation(self, name: str) -> bool:
+        return False
+
+    def play(self, name: str) -> None:
+        pass
+
+    def update(self, delta_time: float) -> None:
+        pass
@@ -0,0 +1,127 @@
+"""Génération procédurale des sprites du cycliste (pas d'assets externes)."""
+
+import functools
+from typing import Tuple
+
+import numpy as np
+import pygame
+
+Color = Tuple[int, int, int]
+
+
+def _body_sprite(width: int, height: int, color: Color,
+                 lean: int = 0) -> pygame.Surface:
+    """Corps + tête du cycliste écrits dans un tampon RGBA NumPy puis
+    téléversés en une fois : une passe C (tranche + masque de disque)
+    remplace les appels pygame.draw dispatchés depuis Python."""
+    arr = np.zeros((height, width, 4), dtype=np.uint8)
+    rgba = (*color, 255)
+    # Tronc : un rectangle rempli par tranche.
+    x0 = width // 4 + lean
+    y0 = height // 3
+    arr[y0:y0 + height // 3, x0:x0 + width // 2] = rgba
+    # Tête : disque rasterisé analytiquement.
+    cx = width // 2 + lean
+    cy = height // 4
+    r = width // 6
+    yy, xx = np.ogrid[:height, :width]
+    arr[(xx - cx) ** 2 + (yy - cy) ** 2 <= r * r] = rgba
+    return pygame.image.frombuffer(arr.tobytes(), (width, height), 'RGBA')
+
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convertit la surface au format pixel de l'écran quand un mode
+    vidéo est actif : les blits suivants prennent le chemin SDL rapide
+    au lieu d'une conversion de format par pixel à chaque frame."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
+
+
+class SpriteGenerator:
+    """Dessine les frames d'animation du cycliste avec pygame.draw.
+
+    Les générateurs sont mémoïsés : un même jeu de paramètres (taille,
+    couleur, nombre de frames) revient à chaque réapparition ou
+    rechargement, et les frames sont immuables une fois produites —
+    elles sont donc retournées en tuples partagés. Pour bénéficier
+    du format natif de l'écran, appeler les générateurs après
+    display.set_mode()."""
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def generate_riding_frames(width: int, height: int, color: Color,
+                               frame_count: int = 4) -> Tuple[pygame.Surface, ...]:
+        """Frames de pédalage : le corps est fixe, les jambes alternent."""
+        # Corps + tête invariants, écrits une fois puis copiés
+        # (memcpy) dans chaque frame.
+        base = _body_sprite(width, height, color)
+        frames = []
+        for i in range(frame_count):
+            surface = base.copy()
+            # Jambe animée (alternance selon la frame)
+            leg_offset = (i % 2) * 4 - 2
+            pygame.draw.line(surface, color,
+                             (width // 2, 2 * height // 3),
+                             (width // 2 + leg_offset, height - 2), 3)
+            frames.append(_to_display_format(surface))
+        return tuple(frames)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def generate_carrying_frames(width: int, height: int, color: Color,
+                                 frame_count: int = 4) -> Tuple[pygame.Surface, ...]:
+        """Frames de portage : le vélo est porté sur l'épaule."""
+        base = _body_sprite(width, height, color)
+        frames = []
+        for i in range(frame_count):
+            surface = base.copy()
+            # Vélo porté (cadre stylisé au-dessus de l'épaule)
+            bob = (i % 2)
+            pygame.draw.line(surface, color,
+                             (width // 6, height // 3 + bob),
+                             (5 * width // 6, height // 3 + bob), 2)
+            frames.append(_to_display_format(surface))
+        return tuple(frames)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def generate_remounting_frames(width: int, height: int, color: Color,
+                                   frame_count: int = 4) -> Tuple[pygame.Surface, ...]:
+        """Frames de remontée en selle : le corps se redresse."""
+        frames = []
+        for i in range(frame_count):
+            lean = (frame_count - 1 - i) * 2
+            surface = _body_sprite(width, height, color, lean=lean)
+            frames.append(_to_display_format(surface))
+        return tuple(frames)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def generate_crashed_frames(width: int, height: int, color: Color,
+                                frame_count: int = 4) -> Tuple[pygame.Surface, ...]:
+        """Frames de chute : le sprite bascule et rougit progressivement."""
+        # Sprite pré-rotation invariant : rotate part de la même base à
+        # chaque frame au lieu de la redessiner.
+        base = _body_sprite(width, height, color)
+        # Un seul calque rouge, assez grand pour n'importe quel angle ;
+        # l'intensité par frame passe par set_alpha au lieu d'un fill
+        # RGBA sur une surface neuve à chaque itération.
+        red_overlay = pygame.Surface((width + height, width + height),
+                                     pygame.SRCALPHA)
+        red_overlay.fill((255, 0, 0))
+        frames = []
+        for i in range(frame_count):
+            angle = -90.0 * (i + 1) / frame_count
+            surface = pygame.transform.rotate(base, angle)
+            red_overlay.set_alpha(40 + 30 * i)
+            surface.blit(red_overlay, (0, 0))
+            frames.append(_to_display_format(surface))
+        return tuple(frames)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def generate_static_sprite(width: int, height: int,
+                               color: Color) -> pygame.Surface:
+        """Sprite fixe (menus, aperçus)."""
+        return _to_display_format(_body_sprite(width, height, color))
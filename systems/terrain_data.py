@@ -0,0 +1,103 @@
+"""Types de terrain du parcours et leurs caractéristiques physiques."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+class TerrainType(Enum):
+    """Surfaces rencontrées sur un parcours de cyclo-cross."""
+    ASPHALT = 0
+    GRASS = 1
+    DIRT = 2
+    GRAVEL = 3
+    SAND = 4
+    MUD = 5
+    CONCRETE = 6
+
+
+@dataclass(frozen=True, slots=True)
+class TerrainData:
+    """Caractéristiques immuables d'une surface.
+
+    Les instances vivent dans `TERRAIN_TABLE`, construite une fois au
+    chargement du module ; la validation ne tourne qu'en mode debug.
+    """
+    terrain_type: TerrainType
+    name: str
+    color: Tuple[int, int, int]
+    speed_multiplier: float
+    grip_level: float
+    stamina_drain: float
+    roughness: float
+    slope: float
+    camber: float
+    # Couleur de liseré dérivée de `color`, calculée une fois ici plutôt
+    # qu'à chaque construction de surface de tuile.
+    border_color: Tuple[int, int, int] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'border_color',
+                           tuple(max(0, c - 20) for c in self.color))
+        if __debug__:
+            assert 0.0 < self.speed_multiplier <= 1.5, self.speed_multiplier
+            assert 0.0 <= self.grip_level <= 1.0, self.grip_level
+            assert self.stamina_drain >= 0.0, self.stamina_drain
+            assert 0.0 <= self.roughness <= 1.0, self.roughness
+
+
+# Table précalculée : toute consultation à chaud est un accès dict + slot.
+TERRAIN_TABLE: Dict[TerrainType, TerrainData] = {
+    TerrainType.ASPHALT: TerrainData(
+        TerrainType.ASPHALT, "Asphalte", (90, 90, 95),
+        1.2, 0.95, 0.8, 0.05, 0.0, 0.0),
+    TerrainType.GRASS: TerrainData(
+        TerrainType.GRASS, "Herbe", (70, 140, 60),
+        0.9, 0.75, 1.0, 0.3, 0.5, 1.0),
+    TerrainType.DIRT: TerrainData(
+        TerrainType.DIRT, "Terre", (120, 90, 60),
+        0.95, 0.7, 1.1, 0.4, 1.0, 0.5),
+    TerrainType.GRAVEL: TerrainData(
+        TerrainType.GRAVEL, "Gravier", (150, 140, 130),
+        0.85, 0.55, 1.3, 0.6, 0.0, 1.5),
+    TerrainType.SAND: TerrainData(
+        TerrainType.SAND, "Sable", (210, 190, 130),
+        0.6, 0.4, 1.8, 0.7, 0.0, 0.0),
+    TerrainType.MUD: TerrainData(
+        TerrainType.MUD, "Boue", (80, 60, 40),
+        0.5, 0.25, 2.0, 0.8, -0.5, 2.0),
+    TerrainType.CONCRETE: TerrainData(
+        TerrainType.CONCRETE, "Béton", (160, 160, 165),
+        1.15, 0.9, 0.8, 0.1, 3.0, 0.0),
+}
+
+
+# Accès par valeur entière (grilles int8) : TERRAIN_BY_VALUE[v] est le
+# TerrainData dont TerrainType.value == v.
+TERRAIN_BY_VALUE: Tuple[TerrainData, ...] = tuple(
+    TERRAIN_TABLE[t] for t in TerrainType)
+
+# Vue SoA de la table : un tableau par champ, indexé par
+# TerrainType.value. Les systèmes qui échantillonnent le terrain pour N
+# entités font un seul "fancy index" NumPy au lieu de N lectures
+# dict + attribut.
+_ORDERED = TERRAIN_BY_VALUE
+SPEED_MULTIPLIERS = np.array([d.speed_multiplier for d in _ORDERED],
+                             dtype=np.float32)
+GRIP_LEVELS = np.array([d.grip_level for d in _ORDERED], dtype=np.float32)
+STAMINA_DRAINS = np.array([d.stamina_drain for d in _ORDERED],
+                          dtype=np.float32)
+ROUGHNESS = np.array([d.roughness for d in _ORDERED], dtype=np.float32)
+SLOPES = np.array([d.slope for d in _ORDERED], dtype=np.float32)
+CAMBERS = np.array([d.camber for d in _ORDERED], dtype=np.float32)
+del _ORDERED
+
+
+class TerrainFactory:
+    """Accès aux TerrainData partagés (poids-mouche)."""
+
+    @staticmethod
+    def create(terrain_type: TerrainType) -> TerrainData:
+        return TERRAIN_TABLE[terrain_type]
@@ -0,0 +1,390 @@
+"""Grille de terrain du parcours : stockage, requêtes et rendu."""
+
+import functools
+import itertools
+import math
+import operator
+from typing import Iterator, List, Optional
+
+import numpy as np
+import pygame
+
+from systems.terrain_data import (TERRAIN_BY_VALUE, TerrainData,
+                                  TerrainType)
+from systems.terrain_tile import TerrainTile
+from utils.vector2 import Vector2
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - accélération optionnelle
+    numba = None
+
+# Extracteur de TerrainType.value sans lambda (une frame Python de
+# moins par cellule dans les rechargements de grille).
+_VALUE_GETTER = operator.attrgetter('value')
+
+# Côté des macro-blocs de rendu (8×8 tuiles).
+_BLOCK = 8
+# Côté des macro-cellules de l'index spatial à deux niveaux (16×16).
+_MACRO = 16
+
+
+def _morton_offsets(side: int):
+    """Offsets (dx, dy) d'un bloc carré en ordre de Morton (bits de x et
+    y entrelacés) : meilleure localité 2D que le balayage ligne à ligne."""
+    def interleave(v: int) -> int:
+        out = 0
+        for bit in range(side.bit_length()):
+            out |= ((v >> bit) & 1) << (2 * bit)
+        return out
+    order = sorted(((x, y) for y in range(side) for x in range(side)),
+                   key=lambda p: interleave(p[0]) | (interleave(p[1]) << 1))
+    return tuple(order)
+
+
+_MORTON_8 = _morton_offsets(_BLOCK)
+
+# TERRAIN_BY_VALUE prolongé d'un None en dernière position : indexer
+# avec -1 (hors carte) retombe dessus, sans branche par élément.
+_TERRAIN_OBJECTS = np.array(TERRAIN_BY_VALUE + (None,), dtype=object)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_tile_surface(type_value: int, tile_size: int) -> pygame.Surface:
+    """Surface poids-mouche d'un type de terrain, sans reconstruire de
+    TerrainTile jetable à chaque recomposition du fond ou du rendu."""
+    return TerrainTile(TERRAIN_BY_VALUE[type_value], 0, 0,
+                       tile_size)._surface
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_macro_surface(type_value: int, tile_size: int) -> pygame.Surface:
+    """Macro-cellule 16×16 uniforme pré-composée à partir de la tuile
+    poids-mouche : le rendu de repli la blitte d'un coup en gardant le
+    liseré de chaque tuile (un fill de couleur unie le perdrait)."""
+    tile = _shared_tile_surface(type_value, tile_size)
+    side = _MACRO * tile_size
+    surface = pygame.Surface((side, side))
+    for y in range(_MACRO):
+        for x in range(_MACRO):
+            surface.blit(tile, (x * tile_size, y * tile_size))
+    return surface
+
+
+def _sample_kernel(grid, width, height, tile_size, px, py, out):
+    """Échantillonne le type de terrain pour N positions (-1 hors carte).
+    Compilé par Numba quand il est disponible."""
+    for i in range(px.shape[0]):
+        # Division entière sur le flottant (plancher) : int() d'abord
+        # tronquerait vers zéro et rabattrait ]-1, 0[ sur la colonne 0.
+        gx = int(px[i] // tile_size)
+        gy = int(py[i] // tile_size)
+        if 0 <= gx < width and 0 <= gy < height:
+            out[i] = grid[gy, gx]
+        else:
+            out[i] = -1
+
+
+if numba is not None:
+    _sample_kernel = numba.njit(cache=True)(_sample_kernel)
+
+
+class TerrainManager:
+    """Grille de terrain stockée comme tableau NumPy int8 de valeurs de
+    TerrainType : un octet par cellule au lieu d'un objet Python.
+
+    Les `TerrainTile` ne sont matérialisés que lorsqu'un appelant en
+    demande un (physique, debug) ; leur surface vient du cache
+    poids-mouche, la construction est donc bon marché."""
+
+    __slots__ = ('width', 'height', 'tile_size', '_tile_shift',
+                 '_type_grid', '_background', '_macro', '_rect_x', '_rect_y',
+                 '_visible_area', '_blit_buffer')
+
+    def __init__(self, width: int, height: int, tile_size: int = 32,
+                 default_terrain: TerrainType = TerrainType.GRASS):
+        self.width = width
+        self.height = height
+        self.tile_size = tile_size
+        # Décalage binaire équivalent à // tile_size quand la taille de
+        # tuile est une puissance de deux (cas nominal : 32).
+        self._tile_shift = (tile_size.bit_length() - 1
+                            if tile_size & (tile_size - 1) == 0 else None)
+        self._type_grid = np.full((height, width), default_terrain.value,
+                                  dtype=np.int8)
+        # Coordonnées monde des colonnes/lignes de tuiles en SoA : les
+        # tests d'intersection par lot se font en comparaisons NumPy au
+        # lieu de N rects Python.
+        self._rect_x = np.arange(width, dtype=np.int32) * tile_size
+        self._rect_y = np.arange(height, dtype=np.int32) * tile_size
+        # Index grossier à deux niveaux : une valeur de terrain quand la
+        # macro-cellule 16×16 est uniforme, None sinon. Permet de zapper
+        # des régions entières en rendu comme en requête spatiale.
+        # Construit paresseusement : un chargeur qui va écraser la
+        # grille ne paie pas l'index de la carte par défaut.
+        self._macro: Optional[List[List[Optional[int]]]] = None
+        # Fond pré-composé : la grille étant immuable entre deux
+        # rechargements, tout le terrain est assemblé une fois et le
+        # rendu par frame se réduit à un seul blit. Composé au premier
+        # rendu (pas ici : le fond tout-herbe de la construction serait
+        # jeté par le premier chargement de carte).
+        self._background: Optional[pygame.Surface] = None
+        # Rect de fenêtre visible réutilisé à chaque frame plutôt que
+        # réalloué.
+        self._visible_area = pygame.Rect(0, 0, 0, 0)
+        # Tampon de paires (surface, position) réutilisé par le rendu de
+        # repli : vidé à chaque frame, jamais réalloué, donc sa capacité
+        # reste dimensionnée au pic de tuiles visibles.
+        self._blit_buffer: list = []
+
+    def _tile_surface(self, type_value: int) -> pygame.Surface:
+        """Surface partagée du type de terrain (via le cache de tuile)."""
+        return _shared_tile_surface(type_value, self.tile_size)
+
+    def get_tile_at_grid(self, grid_x: int, grid_y: int) -> Optional[TerrainTile]:
+        """Tuile aux coordonnées grille, matérialisée à la demande."""
+        if (grid_x < 0 or grid_y < 0
+                or grid_x >= self.width or grid_y >= self.height):
+            return None
+        terrain_data = TERRAIN_BY_VALUE[self._type_grid[grid_y, grid_x]]
+        return TerrainTile(terrain_data, grid_x, grid_y, self.tile_size)
+
+    def get_terrain_at_position(self, position: Vector2) -> Optional[TerrainData]:
+        """Terrain sous une position monde (appelé par la physique à
+        chaque tick ; tout est en ligne, sans appel intermédiaire)."""
+        x = position.x
+        y = position.y
+        # int() tronque vers zéro : une position dans ]-1, 0[ tomberait
+        # sur la colonne 0 au lieu d'être hors carte.
+        if x < 0.0 or y < 0.0:
+            return None
+        shift = self._tile_shift
+        if shift is not None:
+            grid_x = int(x) >> shift
+            grid_y = int(y) >> shift
+        else:
+            grid_x = int(x // self.tile_size)
+            grid_y = int(y // self.tile_size)
+        if grid_x < self.width and grid_y < self.height:
+            return TERRAIN_BY_VALUE[self._type_grid[grid_y, grid_x]]
+        return None
+
+    def sample_terrain_types(self, positions: np.ndarray) -> np.ndarray:
+        """Types de terrain pour un lot de positions monde.
+
+        `positions` est un tableau (N, 2) ; retourne un tableau int8 de
+        valeurs de TerrainType, -1 hors carte. Une requête par lot au
+        lieu de N appels à get_terrain_at_position.
+        """
+        positions = np.asarray(positions)
+        n = positions.shape[0]
+        out = np.empty(n, dtype=np.int8)
+        if numba is not None:
+            _sample_kernel(self._type_grid, self.width, self.height,
+                           self.tile_size,
+                           np.ascontiguousarray(positions[:, 0]),
+                           np.ascontiguousarray(positions[:, 1]), out)
+            return out
+        # Repli vectorisé NumPy : même résultat, tout en C.
+        gx = (positions[:, 0] // self.tile_size).astype(np.intp)
+        gy = (positions[:, 1] // self.tile_size).astype(np.intp)
+        valid = ((gx >= 0) & (gx < self.width) &
+                 (gy >= 0) & (gy < self.height))
+        out.fill(-1)
+        out[valid] = self._type_grid[gy[valid], gx[valid]]
+        return out
+
+    def get_terrain_at_positions(self, positions: np.ndarray) -> np.ndarray:
+        """TerrainData pour un lot de positions monde (None hors
+        carte) : un seul passage C au lieu de N appels scalaires."""
+        return _TERRAIN_OBJECTS[self.sample_terrain_types(positions)]
+
+    def query_tiles_in_rect(self, rect: pygame.Rect) -> np.ndarray:
+        """Vue (sans copie) de la grille de types couverte par un rect
+        monde, obtenue par recherche binaire sur les coordonnées SoA."""
+        x0 = int(np.searchsorted(self._rect_x, rect.left, side='right')) - 1
+        y0 = int(np.searchsorted(self._rect_y, rect.top, side='right')) - 1
+        x1 = int(np.searchsorted(self._rect_x, rect.right, side='left'))
+        y1 = int(np.searchsorted(self._rect_y, rect.bottom, side='left'))
+        return self._type_grid[max(0, y0):y1, max(0, x0):x1]
+
+    def set_terrain_from_grid(self, terrain_grid: List[List[TerrainType]]) -> None:
+        """Recharge la grille depuis une matrice de TerrainType."""
+        if len(terrain_grid) != self.height:
+            raise ValueError(
+                f"Grille de {len(terrain_grid)} lignes, {self.height} attendues")
+        for y, row in enumerate(terrain_grid):
+            if len(row) != self.width:
+                raise ValueError(
+                    f"Ligne {y} : {len(row)} colonnes, {self.width} attendues")
+        # Écriture en place dans le tableau existant, en un seul passage
+        # C : fromiter consomme le flux aplati des valeurs d'enum sans
+        # construire de listes intermédiaires ni boucler par ligne.
+        flat = np.fromiter(
+            map(_VALUE_GETTER, itertools.chain.from_iterable(terrain_grid)),
+            dtype=np.int8, count=self.width * self.height)
+        self._type_grid[...] = flat.reshape(self.height, self.width)
+        self.finalize_terrain()
+
+    def set_terrain_row(self, y: int, row: List[TerrainType]) -> None:
+        """Écrit une ligne de TerrainType en place dans la grille, sans
+        reconstruire les index : permet à un chargeur de diffuser les
+        lignes une à une (une seule ligne Python vivante à la fois).
+        Appeler finalize_terrain() une fois le flux consommé."""
+        if not 0 <= y < self.height:
+            raise ValueError(f"Ligne {y} hors grille (hauteur {self.height})")
+        if len(row) != self.width:
+            raise ValueError(
+                f"Ligne {y} : {len(row)} colonnes, {self.width} attendues")
+        self._type_grid[y, :] = np.fromiter(
+            map(_VALUE_GETTER, row), dtype=np.int8, count=self.width)
+
+    def set_terrain_from_values(self, values: np.ndarray) -> None:
+        """Recharge la grille depuis un tableau de valeurs de
+        TerrainType (chargement binaire) : copie en place, sans objets
+        Python par cellule."""
+        if values.shape != (self.height, self.width):
+            raise ValueError(
+                f"Grille {values.shape}, ({self.height}, {self.width}) attendu")
+        self._type_grid[...] = values
+        self.finalize_terrain()
+
+    def finalize_terrain(self) -> None:
+        """Clôt une mutation de la grille (rechargement complet ou flux
+        de set_terrain_row) : reconstruit l'index grossier et invalide
+        le fond, qui se recomposera au premier rendu."""
+        self._rebuild_macro()
+        self._background = None
+
+    def _rebuild_macro(self) -> None:
+        """Reconstruit l'index grossier depuis la grille fine."""
+        grid = self._type_grid
+        macro = []
+        for my in range(0, self.height, _MACRO):
+            row = []
+            for mx in range(0, self.width, _MACRO):
+                block = grid[my:my + _MACRO, mx:mx + _MACRO]
+                first = int(block.flat[0])
+                row.append(first if (block == first).all() else None)
+            macro.append(row)
+        self._macro = macro
+
+    def macro_cell_terrain(self, grid_x: int, grid_y: int) -> Optional[int]:
+        """Valeur de terrain de la macro-cellule couvrant (x, y) si elle
+        est uniforme, None sinon."""
+        if self._macro is None:
+            self._rebuild_macro()
+        return self._macro[grid_y // _MACRO][grid_x // _MACRO]
+
+    def rebuild_background(self) -> None:
+        """Recompose le fond complet du terrain (au premier rendu après
+        une invalidation, jamais par frame)."""
+        background = pygame.Surface((self.get_world_width(),
+                                     self.get_world_height()))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        ts = self.tile_size
+        surfaces = {int(v): self._tile_surface(int(v))
+                    for v in np.unique(self._type_grid)}
+        grid = self._type_grid
+        for y in range(self.height):
+            row = grid[y]
+            row_y = y * ts
+            for x in range(self.width):
+                background.blit(surfaces[row[x]], (x * ts, row_y))
+        self._background = background
+
+    def iter_tiles(self) -> Iterator[TerrainTile]:
+        """Itère sur les tuiles en ordre ligne à ligne, matérialisées
+        une à une : aucune liste O(largeur × hauteur) n'est allouée."""
+        tile_size = self.tile_size
+        grid = self._type_grid
+        for y in range(self.height):
+            row = grid[y]
+            for x in range(self.width):
+                yield TerrainTile(TERRAIN_BY_VALUE[row[x]], x, y, tile_size)
+
+    def get_all_tiles(self) -> List[TerrainTile]:
+        """Liste complète des tuiles ; préférer iter_tiles() quand une
+        simple traversée suffit."""
+        return list(self.iter_tiles())
+
+    def get_world_width(self) -> int:
+        return self.width * self.tile_size
+
+    def get_world_height(self) -> int:
+        return self.height * self.tile_size
+
+    def render(self, screen: pygame.Surface, camera_offset: Vector2) -> None:
+        """Rend la fenêtre visible du fond pré-composé (un seul blit ;
+        le fond est recomposé paresseusement s'il a été invalidé)."""
+        if self._background is None:
+            self.rebuild_background()
+        visible_area = self._visible_area
+        visible_area.update(camera_offset.x, camera_offset.y,
+                            screen.get_width(), screen.get_height())
+        screen.blit(self._background, (0, 0), area=visible_area)
+
+    def _render_tiles(self, screen: pygame.Surface,
+                      camera_offset: Vector2) -> None:
+        """Rendu cellule à cellule, batché (repli sans fond pré-composé)."""
+        screen_rect = screen.get_rect()
+        start_x = max(0, int(camera_offset.x // self.tile_size))
+        start_y = max(0, int(camera_offset.y // self.tile_size))
+        end_x = min(self.width, int(
+            (camera_offset.x + screen_rect.width) // self.tile_size) + 1)
+        end_y = min(self.height, int(
+            (camera_offset.y + screen_rect.height) // self.tile_size) + 1)
+        # Un seul appel C batché plutôt qu'un blit par tuile. Parcours
+        # par macro-blocs de 8×8, en ordre de Morton à l'intérieur de
+        # chaque bloc : les blocs hors champ sont écartés d'un coup et
+        # les accès grille/cache de surfaces restent spatialement groupés.
+        ts = self.tile_size
+        grid = self._type_grid
+        if self._macro is None:
+            self._rebuild_macro()
+        macro = self._macro
+        surfaces = {int(v): self._tile_surface(int(v))
+                    for v in np.unique(grid)}
+        # Plancher unique de l'offset caméra : sans lui, chaque blit
+        # tronquerait sa destination flottante indépendamment et le
+        # chemin macro (une destination pour 16×16 tuiles) divergerait
+        # d'un pixel des blits tuile à tuile aux offsets fractionnaires.
+        ox = math.floor(camera_offset.x)
+        oy = math.floor(camera_offset.y)
+        blits = self._blit_buffer
+        blits.clear()
+        append = blits.append
+        # Premier niveau : macro-cellules 16×16. Les cellules uniformes
+        # partent en un seul blit de macro-surface ; les autres
+        # repassent par les blocs de Morton 8×8.
+        for my in range(start_y - start_y % _MACRO, end_y, _MACRO):
+            for mx in range(start_x - start_x % _MACRO, end_x, _MACRO):
+                x0 = max(mx, start_x)
+                y0 = max(my, start_y)
+                x1 = min(mx + _MACRO, end_x)
+                y1 = min(my + _MACRO, end_y)
+                uniform = macro[my // _MACRO][mx // _MACRO]
+                if uniform is not None:
+                    # Un seul blit de la macro-surface pré-composée
+                    # (fenêtré sur la portion visible de la cellule) :
+                    # mêmes pixels que tuile à tuile, liseré compris.
+                    append((_shared_macro_surface(uniform, ts),
+                            (x0 * ts - ox, y0 * ts - oy),
+                            pygame.Rect((x0 - mx) * ts, (y0 - my) * ts,
+                                        (x1 - x0) * ts, (y1 - y0) * ts)))
+                    continue
+                for block_y in range(my, y1, _BLOCK):
+                    for block_x in range(mx, x1, _BLOCK):
+                        for dx, dy in _MORTON_8:
+                            x = block_x + dx
+                            y = block_y + dy
+                            if x0 <= x < x1 and y0 <= y < y1:
+                                append((surfaces[grid[y, x]],
+                                        (x * ts - ox, y * ts - oy)))
+        screen.blits(blits, doreturn=False)
+
+    def clear(self) -> None:
+        self._type_grid = np.full((self.height, self.width),
+                                  TerrainType.GRASS.value, dtype=np.int8)
+        self.finalize_terrain()
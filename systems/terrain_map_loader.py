@@ -0,0 +1,145 @@
+"""Sauvegarde et chargement des cartes de terrain."""
+
+import json
+from typing import Dict
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - décodage JSON accéléré optionnel
+    orjson = None
+
+from systems.terrain_data import TerrainType
+from systems.terrain_manager import TerrainManager
+
+# Résolution nom -> type en un accès dict, au lieu d'un balayage de
+# l'enum par cellule.
+_NAME_TO_TYPE = {t.name: t for t in TerrainType}
+_NAME_TO_VALUE = {t.name: t.value for t in TerrainType}
+# Résolution inverse valeur -> nom, indexable par la grille entière en
+# une seule opération vectorisée.
+_VALUE_TO_NAME = np.array([t.name for t in TerrainType])
+
+
+class TerrainMapLoader:
+    """Sérialise les cartes en JSON lisible (édition manuelle) ou en
+    binaire NumPy compressé (chargement rapide en jeu)."""
+
+    FORMAT_VERSION = 1
+
+    @staticmethod
+    def save_to_file(manager: TerrainManager, path: str,
+                     name: str = "carte") -> None:
+        """Écrit la carte en JSON, types de terrain par nom (sérialisée
+        par orjson si présent)."""
+        data = TerrainMapLoader.to_dict(manager, name)
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(data))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+
+    @staticmethod
+    def to_dict(manager: TerrainManager, name: str = "carte") -> Dict:
+        # Export des noms en deux opérations C (indexation avancée puis
+        # tolist), au lieu d'un accès TERRAIN_BY_VALUE par cellule.
+        terrain = _VALUE_TO_NAME[manager._type_grid].tolist()
+        return {
+            "version": TerrainMapLoader.FORMAT_VERSION,
+            "name": name,
+            "width": manager.width,
+            "height": manager.height,
+            "tile_size": manager.tile_size,
+            "terrain": terrain,
+        }
+
+    @staticmethod
+    def load_from_file(path: str) -> TerrainManager:
+        """Charge une carte JSON (décodée par orjson si présent)."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return TerrainMapLoader.load_from_dict(data)
+
+    @staticmethod
+    def load_from_dict(data: Dict) -> TerrainManager:
+        """Reconstruit un TerrainManager depuis la forme dict du JSON."""
+        width = data["width"]
+        rows = data["terrain"]
+        if not all(len(row) == width for row in rows):
+            bad = next(y for y, row in enumerate(rows) if len(row) != width)
+            raise ValueError(
+                f"Ligne {bad} : {len(rows[bad])} colonnes, {width} attendues")
+        height = data["height"]
+        if len(rows) != height:
+            raise ValueError(
+                f"Grille de {len(rows)} lignes, {height} attendues")
+        manager = TerrainManager(width, height, data["tile_size"])
+        # Les lignes sont diffusées une à une dans la grille : une seule
+        # ligne de TerrainType existe côté Python à la fois, au lieu
+        # d'un tableau intermédiaire de la carte entière.
+        try:
+            for y, row in TerrainMapLoader._iter_terrain_rows(rows):
+                manager.set_terrain_row(y, row)
+        except KeyError as exc:
+            raise ValueError(f"Type de terrain inconnu : {exc}") from None
+        manager.finalize_terrain()
+        return manager
+
+    @staticmethod
+    def _iter_terrain_rows(rows):
+        """Générateur (y, ligne de TerrainType) : résout les noms ligne
+        par ligne pour les consommateurs en flux (set_terrain_row)."""
+        name_to_type = _NAME_TO_TYPE
+        for y, row in enumerate(rows):
+            yield y, [name_to_type[name] for name in row]
+
+    @staticmethod
+    def save_to_file_binary(manager: TerrainManager, path: str,
+                            name: str = "carte") -> None:
+        """Écrit la carte en .npz compressé : la grille part en uint8
+        brut (memcpy au chargement) au lieu d'entiers en ASCII, les
+        métadonnées restent en JSON dans une entrée annexe."""
+        meta = {
+            "version": TerrainMapLoader.FORMAT_VERSION,
+            "name": name,
+            "width": manager.width,
+            "height": manager.height,
+            "tile_size": manager.tile_size,
+        }
+        np.savez_compressed(
+            path,
+            types=manager._type_grid.astype(np.uint8),
+            meta_json=np.frombuffer(
+                json.dumps(meta).encode("utf-8"), dtype=np.uint8))
+
+    @staticmethod
+    def load_from_file_binary(path: str) -> TerrainManager:
+        """Relit une carte .npz : la grille arrive déjà typée, sans
+        passage par des objets Python par cellule."""
+        with np.load(path) as data:
+            meta = json.loads(data["meta_json"].tobytes().decode("utf-8"))
+            types = data["types"]
+            manager = TerrainManager(meta["width"], meta["height"],
+                                     meta["tile_size"])
+            manager.set_terrain_from_values(types)
+        return manager
+
+    @staticmethod
+    def create_test_map(width: int, height: int,
+                        tile_size: int = 32) -> TerrainManager:
+        """Carte d'essai : une bande verticale par type de terrain."""
+        manager = TerrainManager(width, height, tile_size)
+        # Bandes calculées en deux opérations C : indice de bande par
+        # colonne, puis diffusion de la ligne sur toute la hauteur.
+        type_values = np.array([t.value for t in TerrainType],
+                               dtype=np.uint8)
+        n_bands = len(type_values)
+        band_idx = np.minimum(np.arange(width) * n_bands // width,
+                              n_bands - 1)
+        row = type_values[band_idx]
+        manager.set_terrain_from_values(
+            np.broadcast_to(row, (height, width)))
+        return manager
@@ -0,0 +1,118 @@
+"""Tuile de terrain : une cellule du parcours et sa surface de rendu."""
+
+import pygame
+
+from systems.terrain_data import TerrainData
+from utils.vector2 import Vector2
+
+
+class TerrainTile:
+    """Cellule de la grille de terrain.
+
+    Les tuiles d'un même type partagent une seule surface (poids-mouche),
+    mise en cache par (type de terrain, taille de tuile). `__slots__`
+    supprime le __dict__ par tuile — des dizaines de milliers d'instances
+    sur une grande carte."""
+
+    __slots__ = ('terrain_data', 'grid_x', 'grid_y', 'tile_size', '_rect',
+                 'world_x', 'world_y', '_center', '_surface')
+
+    _surface_cache = {}
+
+    def __init__(self, terrain_data: TerrainData, grid_x: int, grid_y: int,
+                 tile_size: int):
+        self._init(terrain_data, grid_x, grid_y, tile_size)
+
+    def _init(self, terrain_data: TerrainData, grid_x: int, grid_y: int,
+              tile_size: int) -> None:
+        """(Ré)initialise tous les slots ; partagé entre __init__ et la
+        réutilisation par TerrainTilePool."""
+        self.terrain_data = terrain_data
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        self.tile_size = tile_size
+        # Coordonnées monde précalculées (entiers) pour les appelants
+        # chauds ; le rect sert au rendu et aux collisions pygame.
+        self.world_x = grid_x * tile_size
+        self.world_y = grid_y * tile_size
+        self._center = (self.world_x + tile_size // 2,
+                        self.world_y + tile_size // 2)
+        # Le Rect n'est construit qu'à la demande (collisions pygame) ;
+        # les coordonnées SoA du gestionnaire couvrent le reste.
+        self._rect = None
+        self._surface = None
+        self._create_surface()
+
+    def _create_surface(self) -> None:
+        """Récupère (ou construit une seule fois par type) la surface
+        partagée : fond + liseré sombre."""
+        key = (self.terrain_data.terrain_type, self.tile_size)
+        surface = TerrainTile._surface_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.tile_size, self.tile_size))
+            surface.fill(self.terrain_data.color)
+            pygame.draw.rect(surface, self.terrain_data.border_color,
+                             surface.get_rect(), 1)
+            # Aligné sur le format de l'écran : le blit devient une
+            # copie directe côté SDL, sans conversion par pixel.
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            TerrainTile._surface_cache[key] = surface
+        self._surface = surface
+
+    @property
+    def image(self) -> pygame.Surface:
+        """Alias de la surface partagée, au nom attendu par le protocole
+        sprite de pygame (Group.draw, blits sur paires image/rect)."""
+        return self._surface
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Rect pygame de la tuile, construit paresseusement."""
+        if self._rect is None:
+            self._rect = pygame.Rect(self.world_x, self.world_y,
+                                     self.tile_size, self.tile_size)
+        return self._rect
+
+    def render(self, screen: pygame.Surface, camera_offset: Vector2) -> None:
+        """Blitte la tuile ; le culling est fait par TerrainManager."""
+        screen.blit(self._surface, (self.world_x - camera_offset.x,
+                                    self.world_y - camera_offset.y))
+
+    def get_world_position(self) -> Vector2:
+        """Coin haut-gauche de la tuile en coordonnées monde."""
+        return Vector2(self.world_x, self.world_y)
+
+    def get_center_position(self) -> Vector2:
+        """Centre de la tuile en coordonnées monde."""
+        return Vector2(self._center[0], self._center[1])
+
+
+class TerrainTilePool:
+    """Réserve de TerrainTile réutilisables.
+
+    La grille elle-même ne matérialise plus de tuiles, mais les chemins
+    qui en consomment par rafales (éditeur, balayages de debug) peuvent
+    rendre les leurs au lieu de laisser le GC les ramasser."""
+
+    __slots__ = ('_free',)
+
+    def __init__(self):
+        self._free = []
+
+    def acquire(self, terrain_data: TerrainData, grid_x: int, grid_y: int,
+                tile_size: int) -> TerrainTile:
+        """Tuile réinitialisée depuis la réserve, ou neuve si vide."""
+        if self._free:
+            tile = self._free.pop()
+            tile._init(terrain_data, grid_x, grid_y, tile_size)
+            return tile
+        return TerrainTile(terrain_data, grid_x, grid_y, tile_size)
+
+    def release(self, tile: TerrainTile) -> None:
+        """Rend une tuile à la réserve ; l'appelant ne doit plus s'en
+        servir ensuite."""
+        self._free.append(tile)
+
+    def __len__(self) -> int:
+        return len(self._free)
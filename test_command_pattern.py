@@ -0,0 +1,62 @@
+"""Tests du patron Commande : liaison touches → actions."""
+
+import pygame
+import pytest
+
+from core.command import (AccelerateCommand, BrakeCommand, CrashCommand,
+                          InputHandler, ToggleCarryCommand)
+from core.state_machine import StateType
+from entities.cyclist import Cyclist
+
+
+@pytest.fixture
+def cyclist(pg):
+    return Cyclist("pilote")
+
+
+def test_accelerate_applies_force(cyclist):
+    AccelerateCommand(force=300.0).execute(cyclist)
+    assert cyclist.physics.acceleration.x > 0
+
+
+def test_brake_damps_velocity(cyclist):
+    cyclist.physics.velocity.x = 10.0
+    BrakeCommand(braking=0.5).execute(cyclist)
+    assert cyclist.physics.velocity.x == 5.0
+
+
+def test_toggle_carry_cycles_states(cyclist):
+    toggle = ToggleCarryCommand()
+    toggle.execute(cyclist)
+    assert cyclist.state_machine.current_state_type == StateType.CARRYING
+    toggle.execute(cyclist)
+    assert cyclist.state_machine.current_state_type == StateType.REMOUNTING
+
+
+def test_crash_command(cyclist):
+    CrashCommand().execute(cyclist)
+    assert cyclist.state_machine.current_state_type == StateType.CRASHED
+
+
+def test_input_handler_maps_keys(pg, cyclist):
+    handler = InputHandler()
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)
+    command = handler.handle_event(event)
+    assert isinstance(command, ToggleCarryCommand)
+    command.execute(cyclist)
+    assert cyclist.state_machine.current_state_type == StateType.CARRYING
+
+
+def test_input_handler_ignores_other_events(pg):
+    handler = InputHandler()
+    assert handler.handle_event(
+        pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE)) is None
+
+
+def test_rebinding(pg, cyclist):
+    handler = InputHandler()
+    handler.bind(pygame.K_b, CrashCommand())
+    event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_b)
+    command = handler.handle_event(event)
+    command.execute(cyclist)
+    assert cyclist.state_machine.current_state_type == StateType.CRASHED
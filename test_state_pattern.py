@@ -0,0 +1,62 @@
+"""Tests du patron État : transitions du cycliste et animations."""
+
+import pytest
+
+from core.state_machine import StateType
+from entities.cyclist import Cyclist
+from graphics.animation_controller import AnimationController
+
+
+@pytest.fixture
+def cyclist(pg):
+    return Cyclist("testeur")
+
+
+def test_initial_state_is_riding(cyclist):
+    assert cyclist.state_machine.current_state_type == StateType.RIDING
+
+
+def test_riding_to_carrying_allowed(cyclist):
+    assert cyclist.state_machine.change_state(StateType.CARRYING)
+    assert cyclist.state_machine.current_state_type == StateType.CARRYING
+    assert cyclist.physics.speed_multiplier == 0.5
+
+
+def test_riding_to_remounting_rejected(cyclist):
+    assert not cyclist.state_machine.change_state(StateType.REMOUNTING)
+    assert cyclist.state_machine.current_state_type == StateType.RIDING
+
+
+def test_crash_stops_the_cyclist(cyclist):
+    cyclist.physics.velocity.x = 10.0
+    cyclist.state_machine.change_state(StateType.CRASHED)
+    assert cyclist.physics.velocity.length() == 0.0
+
+
+def test_crashed_remounts_after_deadline(cyclist):
+    cyclist.state_machine.change_state(StateType.CRASHED)
+    cyclist.update(0.016)
+    assert cyclist.state_machine.current_state_type == StateType.CRASHED
+    cyclist._state_deadline = 0.0  # échéance déjà passée
+    cyclist.update(0.016)
+    assert cyclist.state_machine.current_state_type == StateType.REMOUNTING
+
+
+def test_remounting_returns_to_riding(cyclist):
+    cyclist.state_machine.change_state(StateType.CARRYING)
+    cyclist.state_machine.change_state(StateType.REMOUNTING)
+    cyclist._state_deadline = 0.0
+    cyclist.update(0.016)
+    assert cyclist.state_machine.current_state_type == StateType.RIDING
+
+
+def test_states_play_animations(pg, small_surface):
+    controller = AnimationController()
+    # Les quatre frames partagent la même surface : seul le cycle de
+    # frames compte ici, pas les pixels.
+    for name in ("riding", "carrying", "remounting", "crashed"):
+        controller.add_animation(name, [small_surface] * 4)
+    cyclist = Cyclist("anime", animation_controller=controller)
+    assert controller.current_frame is small_surface
+    cyclist.state_machine.change_state(StateType.CRASHED)
+    assert controller._current_name == "crashed"
@@ -0,0 +1,22 @@
+from ui.gauge_widget import CircularGaugeWidget, GaugeWidget
+from ui.stamina_balance_ui import StaminaBalanceUI
+
+__all__ = ["CircularGaugeWidget", "GaugeWidget", "StaminaBalanceUI",
+           "render_all"]
+
+# Tampon de blits partagé par render_all, réutilisé d'une frame à
+# l'autre (même logique que le tampon du rendu de terrain).
+_BLIT_BUFFER: list = []
+
+
+def render_all(screen, widgets) -> None:
+    """Rend un lot de widgets en un seul screen.blits : chaque widget
+    met à jour son composite puis dépose ses tuples de blit, et pygame
+    ne fait qu'un passage C sur le lot."""
+    blits = _BLIT_BUFFER
+    blits.clear()
+    clip = screen.get_clip()
+    for widget in widgets:
+        widget.append_blits(blits, clip)
+    if blits:
+        screen.blits(blits, doreturn=False)
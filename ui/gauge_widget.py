@@ -0,0 +1,437 @@
+"""Jauge horizontale de l'interface (endurance, vitesse...)."""
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pygame
+import pygame.gfxdraw
+
+from utils.colors import Colors
+
+Color = Tuple[int, int, int]
+
+# Seuils de couleur par défaut en tableaux parallèles croissants,
+# consommés par np.searchsorted.
+_DEFAULT_THRESH_ARR = np.array([0.0, 20.0, 40.0, 70.0])
+_DEFAULT_THRESH_COLORS = (Colors.RED, (255, 165, 0), Colors.YELLOW,
+                          Colors.GREEN)
+
+
+def _no_text() -> None:
+    """Variante de _render_text des jauges muettes (ni libellé ni
+    pourcentage)."""
+    return None
+
+
+# Polices partagées par taille : N jauges de même taille réutilisent le
+# même objet Font (et donc son cache de glyphes) au lieu d'en charger N.
+_FONT_CACHE: Dict[int, pygame.font.Font] = {}
+
+
+def _shared_font(size: int) -> pygame.font.Font:
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE.setdefault(size, pygame.font.Font(None, size))
+    return font
+
+
+class GaugeWidget:
+    """Barre de jauge rectangulaire avec libellé et pourcentage.
+
+    Le fond et le liseré ne changent qu'à la reconfiguration : ils sont
+    pré-rendus dans une surface cachée et blittés en un appel, seul le
+    remplissage est dessiné à chaque frame.
+    """
+
+    def __init__(self, position: Tuple[int, int], size: Tuple[int, int],
+                 min_value: float = 0.0, max_value: float = 100.0,
+                 color: Color = Colors.GREEN,
+                 background_color: Color = Colors.DARK_GRAY,
+                 border_color: Color = Colors.WHITE,
+                 border_width: int = 2,
+                 show_percentage: bool = True,
+                 label: str = "",
+                 font_size: int = 24):
+        # Géométrie en scalaires : les chemins chauds lisent _x/_y/_w/_h
+        # sans dépaquetage de tuple ; position et size restent exposés
+        # en propriétés pour les appelants.
+        self._x, self._y = position
+        self._w, self._h = size
+        self.min_value = min_value
+        self.max_value = max_value
+        self.current_value = max_value
+        self.color = color
+        self.background_color = background_color
+        self.border_color = border_color
+        self.border_width = border_width
+        self.show_percentage = show_percentage
+        self.label = label
+        self.font_size = font_size
+        self.frame_count = 0
+        # Barème personnalisé de set_color_by_percentage : référence du
+        # dernier dict fourni et sa forme (seuils triés, couleurs).
+        self._last_thresholds: Optional[Dict[float, Color]] = None
+        self._thresh_arrays: Optional[tuple] = None
+        # Remplissage recalculé à la mutation (set_value), pas au rendu.
+        span = max_value - min_value
+        self._inv_range = 1.0 / span if span > 0.0 else 0.0
+        self._cached_pct = 1.0 if span > 0.0 else 0.0
+        self._fill_width = self._w if span > 0.0 else 0
+        self._font: Optional[pygame.font.Font] = None
+        # Cache du texte rendu (font.render est l'opération la plus
+        # chère ici), indexé par la chaîne affichée : toutes les valeurs
+        # qui se formatent pareil partagent le même rendu.
+        self._cached_text: Optional[str] = None
+        self._cached_text_surface: Optional[pygame.Surface] = None
+        # Fond + liseré pré-rendus ; invalidés par la clé quand la
+        # géométrie ou les couleurs statiques changent.
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._bg_key = None
+        # Rects persistants mutés en place au rendu : aucune allocation
+        # de Rect par frame.
+        self._bg_rect = pygame.Rect(position[0], position[1],
+                                    size[0], size[1])
+        self._fill_rect = pygame.Rect(position[0], position[1], 0, size[1])
+        # Méthode de dessin du remplissage liée une fois : le chemin
+        # sans clignotement ne paie aucun branchement par frame.
+        self._draw_fill_impl = self._draw_fill_blinking
+        self._blink_phase = False
+        # Phase imposée de l'extérieur (HUD) : quand elle est définie,
+        # la jauge ne dérive plus sa propre cadence de son compteur.
+        self._blink_override: Optional[bool] = None
+        # Rendu composite : la jauge complète est recomposée hors écran
+        # seulement quand un mutateur l'a salie ; sinon le rendu par
+        # frame est un unique blit du composite.
+        self._composite: Optional[pygame.Surface] = None
+        self._composite_premul: Optional[pygame.Surface] = None
+        self._dirty = True
+        # Spécialisation à la construction : render pointe directement
+        # sur la variante la plus maigre pour les options choisies,
+        # aucun test de drapeau par frame.
+        self.render = self._render_blinking
+        self._prepare_blit = self._prepare_blit_blinking
+        if not show_percentage and not label:
+            self._render_text = _no_text
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return (self._x, self._y)
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return (self._w, self._h)
+
+    def set_position(self, x: int, y: int) -> None:
+        """Déplace la jauge ; le rect de fond est mis à jour ici, pas à
+        chaque frame."""
+        self._x = x
+        self._y = y
+        self._bg_rect.topleft = (x, y)
+
+    def _get_fill_percentage(self) -> float:
+        """Fraction de remplissage dans [0, 1] (cachée par set_value)."""
+        return self._cached_pct
+
+    def set_value(self, value: float) -> None:
+        """Fixe la valeur courante, bornée à [min, max], et recalcule
+        le remplissage une fois ici plutôt qu'à chaque frame."""
+        value = min(self.max_value, max(self.min_value, value))
+        if value == self.current_value:
+            return
+        self.current_value = value
+        pct = (value - self.min_value) * self._inv_range
+        self._cached_pct = pct
+        self._fill_width = int(self._w * pct)
+        self._dirty = True
+
+    def set_color(self, color: Color) -> None:
+        if color != self.color:
+            self.color = color
+            self._dirty = True
+
+    def set_blink_effect(self, enabled: bool) -> None:
+        """(Dés)active le clignotement en zone critique en reliant la
+        méthode de remplissage, plutôt qu'en testant un drapeau par
+        frame."""
+        self._draw_fill_impl = (self._draw_fill_blinking if enabled
+                                else self._draw_fill)
+        self.render = (self._render_blinking if enabled
+                       else self._render_static)
+        self._prepare_blit = (self._prepare_blit_blinking if enabled
+                              else self._prepare_blit_static)
+        self._dirty = True
+
+    def set_blink_phase(self, on: bool) -> None:
+        """Impose la phase de clignotement calculée en amont (un seul
+        masque binaire partagé par frame pour tout le HUD, au lieu d'une
+        cadence recalculée par jauge)."""
+        self._blink_override = on
+
+    def set_color_by_percentage(
+            self, thresholds: Optional[Dict[float, Color]] = None) -> None:
+        """Choisit la couleur de remplissage selon le pourcentage :
+        vert > 70, jaune > 40, orange > 20, rouge en dessous."""
+        if thresholds is None:
+            arr = _DEFAULT_THRESH_ARR
+            colors = _DEFAULT_THRESH_COLORS
+        else:
+            # Forme triée mémoïsée sur le widget : les appelants passent
+            # le même dict d'une frame à l'autre, la référence retenue
+            # rend le test d'identité sûr (pas de clé id() orpheline).
+            if thresholds is not self._last_thresholds:
+                self._last_thresholds = thresholds
+                keys = sorted(thresholds)
+                self._thresh_arrays = (
+                    np.array(keys), tuple(thresholds[k] for k in keys))
+            arr, colors = self._thresh_arrays
+        # Recherche binaire C : l'indice du dernier seuil <= pourcentage.
+        idx = int(arr.searchsorted(self._cached_pct * 100.0,
+                                   side='right')) - 1
+        self.set_color(colors[idx if idx >= 0 else 0])
+
+    def _ensure_font(self) -> pygame.font.Font:
+        if self._font is None:
+            self._font = _shared_font(self.font_size)
+        return self._font
+
+    def _render_text(self) -> Optional[pygame.Surface]:
+        """Surface du texte de la jauge, recalculée seulement quand la
+        valeur change."""
+        if not self.show_percentage and not self.label:
+            return None
+        parts = []
+        if self.label:
+            parts.append(self.label)
+        if self.show_percentage:
+            parts.append(f"{self._cached_pct * 100.0:.0f}%")
+        text = " ".join(parts)
+        if text != self._cached_text:
+            self._cached_text_surface = self._ensure_font().render(
+                text, True, Colors.WHITE)
+            self._cached_text = text
+        return self._cached_text_surface
+
+    def _draw_fill(self, screen: pygame.Surface, x: int, y: int) -> None:
+        """Dessine le remplissage (chemin sans clignotement)."""
+        if self._fill_width > 0:
+            self._fill_rect.update(x, y, self._fill_width, self._h)
+            pygame.draw.rect(screen, self.color, self._fill_rect)
+
+    def _draw_fill_blinking(self, screen: pygame.Surface,
+                            x: int, y: int) -> None:
+        """Clignotement en zone critique : la phase est maintenue par
+        render, qui ne resalit le composite qu'à son basculement."""
+        if self._blink_phase:
+            return
+        self._draw_fill(screen, x, y)
+
+    def _rebuild_bg(self) -> None:
+        """(Re)compose la surface statique fond + liseré."""
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill(self.background_color)
+        if self.border_width > 0:
+            pygame.draw.rect(surface, self.border_color,
+                             surface.get_rect(), self.border_width)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self._bg_surface = surface
+        self._bg_key = (self.size, self.background_color,
+                        self.border_color, self.border_width)
+
+    def _recompose(self) -> None:
+        """Redessine la jauge complète dans le composite hors écran."""
+        key = (self.size, self.background_color,
+               self.border_color, self.border_width)
+        if self._bg_surface is None or key != self._bg_key:
+            self._rebuild_bg()
+        if (self._composite is None
+                or self._composite.get_size() != self.size):
+            self._composite = pygame.Surface(self.size, pygame.SRCALPHA)
+        self._composite.blit(self._bg_surface, (0, 0))
+        self._draw_fill_impl(self._composite, 0, 0)
+        text_surface = self._render_text()
+        if text_surface is not None:
+            text_rect = text_surface.get_rect(
+                center=(self._w // 2, self._h // 2))
+            self._composite.blit(text_surface, text_rect)
+        # Alpha prémultiplié une fois par recomposition : le blit par
+        # frame passe par le chemin SIMD de SDL.
+        self._composite_premul = self._composite.premul_alpha()
+        self._dirty = False
+
+    def _prepare_blit_static(self, clip: pygame.Rect):
+        """Met le composite à jour et retourne son tuple de blit pour
+        un screen.blits groupé (None hors champ)."""
+        self.frame_count += 1
+        if not clip.colliderect(self._bg_rect):
+            return None
+        if self._dirty:
+            self._recompose()
+        return (self._composite_premul, self._bg_rect, None,
+                pygame.BLEND_PREMULTIPLIED)
+
+    def _prepare_blit_blinking(self, clip: pygame.Rect):
+        """Variante clignotante de _prepare_blit_static."""
+        self.frame_count += 1
+        if not clip.colliderect(self._bg_rect):
+            return None
+        on = (bool(self.frame_count & 16) if self._blink_override is None
+              else self._blink_override)
+        phase = self._cached_pct < 0.2 and on
+        if phase != self._blink_phase:
+            self._blink_phase = phase
+            self._dirty = True
+        if self._dirty:
+            self._recompose()
+        return (self._composite_premul, self._bg_rect, None,
+                pygame.BLEND_PREMULTIPLIED)
+
+    def append_blits(self, out: list, clip: pygame.Rect) -> None:
+        """Ajoute les blits du widget au lot de render_all."""
+        blit = self._prepare_blit(clip)
+        if blit is not None:
+            out.append(blit)
+
+    def _render_static(self, screen: pygame.Surface) -> None:
+        """Variante sans clignotement : cull, recomposition si sale,
+        un blit."""
+        self.frame_count += 1
+        # Élagage hors champ : une jauge repoussée hors du clip (HUD
+        # replié, écran partagé) ne coûte plus aucun appel de dessin.
+        if not screen.get_clip().colliderect(self._bg_rect):
+            return
+        if self._dirty:
+            self._recompose()
+        screen.blit(self._composite_premul, self._bg_rect,
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def _render_blinking(self, screen: pygame.Surface) -> None:
+        """Variante avec clignotement : suit la phase et resalit le
+        composite à son basculement."""
+        self.frame_count += 1
+        if not screen.get_clip().colliderect(self._bg_rect):
+            return
+        on = (bool(self.frame_count & 16) if self._blink_override is None
+              else self._blink_override)
+        phase = self._cached_pct < 0.2 and on
+        if phase != self._blink_phase:
+            self._blink_phase = phase
+            self._dirty = True
+        if self._dirty:
+            self._recompose()
+        screen.blit(self._composite_premul, self._bg_rect,
+                    special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+class CircularGaugeWidget:
+    """Jauge circulaire en camembert (cadence, adhérence).
+
+    L'arc de remplissage n'est rasterisé qu'au premier passage sur un
+    pourcentage entier donné (101 godets possibles, rendus à la
+    demande) ; ensuite le rendu se réduit à deux blits + le texte.
+    """
+
+    def __init__(self, center: Tuple[int, int], radius: int,
+                 min_value: float = 0.0, max_value: float = 100.0,
+                 color: Color = Colors.GREEN,
+                 background_color: Color = Colors.DARK_GRAY,
+                 border_color: Color = Colors.WHITE,
+                 show_percentage: bool = True,
+                 font_size: int = 24):
+        self.center = center
+        self.radius = radius
+        self.min_value = min_value
+        self.max_value = max_value
+        self.current_value = max_value
+        self.color = color
+        self.background_color = background_color
+        self.border_color = border_color
+        self.show_percentage = show_percentage
+        self.font_size = font_size
+        span = max_value - min_value
+        self._inv_range = 1.0 / span if span > 0.0 else 0.0
+        self._cached_pct = 1.0 if span > 0.0 else 0.0
+        self._font: Optional[pygame.font.Font] = None
+        self._cached_text: Optional[str] = None
+        self._cached_text_surface: Optional[pygame.Surface] = None
+        # Fond statique : disque de fond + liseré, composé une fois.
+        side = 2 * radius
+        bg = pygame.Surface((side, side), pygame.SRCALPHA)
+        pygame.draw.circle(bg, background_color, (radius, radius), radius)
+        pygame.draw.circle(bg, border_color, (radius, radius), radius, 2)
+        self._bg_surface = bg
+        # LUT des arcs : un camembert par pourcentage entier, rasterisé
+        # paresseusement (une jauge ne visite qu'une fraction des 101
+        # godets pendant une course).
+        self._fill_surfaces: list = [None] * 101
+        self._blit_pos = (center[0] - radius, center[1] - radius)
+        self._bounds = pygame.Rect(self._blit_pos, (side, side))
+
+    def set_value(self, value: float) -> None:
+        """Fixe la valeur courante, bornée à [min, max]."""
+        self.current_value = min(self.max_value, max(self.min_value, value))
+        self._cached_pct = ((self.current_value - self.min_value)
+                            * self._inv_range)
+
+    def _render_text(self) -> Optional[pygame.Surface]:
+        if not self.show_percentage:
+            return None
+        text = f"{self._cached_pct * 100.0:.0f}%"
+        if text != self._cached_text:
+            if self._font is None:
+                self._font = _shared_font(self.font_size)
+            self._cached_text_surface = self._font.render(
+                text, True, Colors.WHITE)
+            self._cached_text = text
+        return self._cached_text_surface
+
+    def _arc_surface(self, bucket: int) -> pygame.Surface:
+        """Arc rempli du godet (0-100), rasterisé au premier accès :
+        camembert anti-crénelé parti du sommet, sens horaire."""
+        surf = self._fill_surfaces[bucket]
+        if surf is None:
+            radius = self.radius
+            surf = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+            if bucket >= 100:
+                pygame.draw.circle(surf, self.color, (radius, radius),
+                                   radius - 2)
+            elif bucket > 0:
+                # Camembert plein : polygone centre + points d'arc
+                # (gfxdraw n'a pas de filled_pie), liseré anti-crénelé.
+                end = -90.0 + 360.0 * bucket / 100.0
+                r = radius - 2
+                steps = max(2, int(end + 90.0) // 4 + 1)
+                points = [(radius, radius)]
+                for i in range(steps + 1):
+                    angle = math.radians(-90.0 + (end + 90.0) * i / steps)
+                    points.append((radius + int(r * math.cos(angle)),
+                                   radius + int(r * math.sin(angle))))
+                pygame.gfxdraw.filled_polygon(surf, points, self.color)
+                pygame.gfxdraw.aapolygon(surf, points, self.color)
+            self._fill_surfaces[bucket] = surf
+        return surf
+
+    def append_blits(self, out: list, clip: pygame.Rect) -> None:
+        """Ajoute les blits du widget au lot de render_all."""
+        if not clip.colliderect(self._bounds):
+            return
+        pos = self._blit_pos
+        out.append((self._bg_surface, pos))
+        out.append((self._arc_surface(int(self._cached_pct * 100)), pos))
+        text_surface = self._render_text()
+        if text_surface is not None:
+            out.append((text_surface,
+                        text_surface.get_rect(center=self.center)))
+
+    def render(self, screen: pygame.Surface) -> None:
+        """Deux blits (fond, disque pré-rendu du bon rayon) + texte."""
+        pos = self._blit_pos
+        if not screen.get_clip().colliderect(self._bounds):
+            return
+        screen.blit(self._bg_surface, pos)
+        screen.blit(self._arc_surface(int(self._cached_pct * 100)), pos)
+        text_surface = self._render_text()
+        if text_surface is not None:
+            screen.blit(text_surface,
+                        text_surface.get_rect(center=self.center))
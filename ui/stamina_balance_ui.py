@@ -0,0 +1,205 @@
+"""HUD endurance / équilibre et indicateurs de contexte terrain."""
+
+import bisect
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from systems.terrain_data import TerrainData
+from ui.gauge_widget import GaugeWidget, _shared_font
+from utils.colors import Colors
+
+Color = Tuple[int, int, int]
+
+# Bornes du cache de texte : au-delà, les entrées les plus anciennes
+# sont évincées (l'ordre d'insertion des dict fait office de LRU).
+_TEXT_CACHE_MAX = 64
+
+# Offsets relatifs des pictogrammes, figés au chargement du module :
+# aucune liste de sommets reconstruite par frame ni par rasterisation.
+_CAMBER_ARROW_RIGHT = ((0, -4), (0, 4), (8, 0))
+_CAMBER_ARROW_LEFT = ((0, -4), (0, 4), (-8, 0))
+_WARNING_TRIANGLE = ((0, 14), (14, 14), (7, 0))
+
+
+class StaminaBalanceUI:
+    """Panneau HUD du cycliste : jauge d'endurance, barre d'équilibre
+    et panneau de contexte (terrain, adhérence, pente, dévers)."""
+
+    # LUT de couleur d'adhérence : seuils croissants consommés par
+    # bisect, pas de ternaires imbriqués par frame.
+    _GRIP_THRESHOLDS = (0.4, 0.7)
+    _GRIP_COLORS = (Colors.RED, Colors.YELLOW, Colors.GREEN)
+    # Libellés formatés par terrain : les TerrainData sont sept
+    # poids-mouches immuables, leurs chaînes ne se formatent qu'une fois.
+    _labels_cache: Dict[int, Tuple[str, str, str, str]] = {}
+    # Calque des formes vectorielles (pastille, flèche de dévers) par
+    # terrain : rasterisé au premier passage, un seul blit ensuite.
+    _overlay_cache: Dict[tuple, pygame.Surface] = {}
+
+    def __init__(self, position: Tuple[int, int] = (10, 10)):
+        self.position = position
+        x, y = position
+        self.stamina_gauge = GaugeWidget(
+            (x, y), (180, 20), label="Endurance")
+        self.balance_gauge = GaugeWidget(
+            (x, y + 26), (180, 12), min_value=-1.0, max_value=1.0,
+            color=Colors.LIGHT_GRAY, show_percentage=False)
+        self.balance_gauge.set_blink_effect(False)
+        self.frame_count = 0
+        # Phase de clignotement du HUD, dérivée une fois par frame d'un
+        # masque binaire (période 16) et partagée par tous les éléments
+        # clignotants : pas de modulo par jauge ni par icône.
+        self._blink_on = False
+        # Polices prises dans le cache partagé par taille, dès la
+        # construction : pas de test de paresse par frame ni de fichier
+        # TTF rouvert par instance.
+        pygame.font.init()
+        self._context_font = _shared_font(20)
+        self._small_font = _shared_font(16)
+        # Cache des surfaces de texte rendues, clé (police, texte,
+        # couleur) : les libellés du panneau changent rarement d'une
+        # frame à l'autre et font.render domine le coût du HUD.
+        self._text_cache: Dict[tuple, pygame.Surface] = {}
+        # Fond semi-transparent du panneau de contexte (avec liseré),
+        # composé une seule fois au lieu d'une surface neuve par frame.
+        self._info_bg = pygame.Surface((210, 100))
+        self._info_bg.set_alpha(180)
+        self._info_bg.fill(Colors.DARK_GRAY)
+        pygame.draw.rect(self._info_bg, Colors.WHITE,
+                         self._info_bg.get_rect(), 1)
+        if pygame.display.get_surface() is not None:
+            # Format pixel de l'écran : blit par chemin SDL rapide.
+            self._info_bg = self._info_bg.convert()
+            self._info_bg.set_alpha(180)
+        # Dernières valeurs synchronisées sur les jauges : l'endurance
+        # est souvent stable plusieurs frames d'affilée, inutile de
+        # redérouler la chaîne de setters quand rien n'a bougé.
+        self._last_stamina = float("inf")
+        self._last_balance = float("inf")
+        # Icône d'avertissement (triangle + « ! ») pré-dessinée : le
+        # clignotement en faible adhérence devient un blit au lieu d'un
+        # polygon et d'un rendu de texte par frame.
+        self._warning_icon = pygame.Surface((15, 15), pygame.SRCALPHA)
+        pygame.draw.polygon(self._warning_icon, Colors.YELLOW,
+                            _WARNING_TRIANGLE)
+        self._warning_icon.blit(
+            self._small_font.render("!", True, Colors.BLACK), (5, 3))
+        if pygame.display.get_surface() is not None:
+            self._warning_icon = self._warning_icon.convert_alpha()
+
+    @classmethod
+    def _grip_color(cls, grip_level: float) -> Color:
+        return cls._GRIP_COLORS[
+            bisect.bisect_right(cls._GRIP_THRESHOLDS, grip_level)]
+
+    @classmethod
+    def _labels_for(cls, terrain_data: TerrainData
+                    ) -> Tuple[str, str, str, str]:
+        key = terrain_data.terrain_type.value
+        labels = cls._labels_cache.get(key)
+        if labels is None:
+            labels = (
+                f"Terrain: {terrain_data.name}",
+                f"Adhérence: {terrain_data.grip_level * 100.0:.0f}%",
+                f"Pente: {terrain_data.slope:+.1f}°",
+                f"Dévers: {terrain_data.camber:+.1f}°",
+            )
+            cls._labels_cache[key] = labels
+        return labels
+
+    def _render_text(self, font: pygame.font.Font, text: str,
+                     color: Color) -> pygame.Surface:
+        """Surface de texte mise en cache ; éviction des plus anciennes
+        entrées au-delà de la borne."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            if len(cache) >= _TEXT_CACHE_MAX:
+                del cache[next(iter(cache))]
+            cache[key] = surface
+        return surface
+
+    @classmethod
+    def _context_overlay(cls, terrain_data: TerrainData) -> pygame.Surface:
+        """Formes vectorielles du panneau (pastille du terrain, flèche
+        de dévers) pré-rendues par clé de terrain : en régime permanent
+        les pygame.draw par frame deviennent un blit."""
+        key = (terrain_data.terrain_type.value,
+               round(terrain_data.camber, 1))
+        overlay = cls._overlay_cache.get(key)
+        if overlay is None:
+            overlay = pygame.Surface((210, 100), pygame.SRCALPHA)
+            # Pastille de couleur du terrain (coordonnées relatives au
+            # coin du panneau).
+            pygame.draw.circle(overlay, terrain_data.color, (16, 12), 6)
+            # Flèche de dévers : pointe du côté où la pente tire.
+            if terrain_data.camber != 0.0:
+                cx, cy = 120, 67
+                offsets = (_CAMBER_ARROW_RIGHT if terrain_data.camber > 0.0
+                           else _CAMBER_ARROW_LEFT)
+                pygame.draw.polygon(
+                    overlay, Colors.YELLOW,
+                    [(cx + dx, cy + dy) for dx, dy in offsets])
+            cls._overlay_cache[key] = overlay
+        return overlay
+
+    def update(self, stamina_component, balance_component) -> None:
+        """Synchronise les jauges avec les composants (court-circuit
+        quand les valeurs n'ont pas bougé d'un epsilon)."""
+        stamina = stamina_component.current_stamina
+        if abs(stamina - self._last_stamina) > 1e-6:
+            self._last_stamina = stamina
+            self.stamina_gauge.set_value(stamina)
+            self.stamina_gauge.set_color_by_percentage()
+        balance = balance_component.current_balance
+        if abs(balance - self._last_balance) > 1e-6:
+            self._last_balance = balance
+            self.balance_gauge.set_value(balance)
+
+    def render(self, screen: pygame.Surface,
+               terrain_data: Optional[TerrainData] = None) -> None:
+        self.frame_count += 1
+        self._blink_on = bool((self.frame_count >> 3) & 1)
+        self.stamina_gauge.set_blink_phase(self._blink_on)
+        self.stamina_gauge.render(screen)
+        self.balance_gauge.render(screen)
+        if terrain_data is not None:
+            self._render_context_indicators(screen, terrain_data)
+
+    def _render_context_indicators(self, screen: pygame.Surface,
+                                   terrain_data: TerrainData) -> None:
+        """Panneau de contexte : terrain courant, adhérence, pente et
+        dévers, avec pictogrammes."""
+        x_start = self.position[0] + 10
+        y_start = self.position[1] + 50
+        screen.blit(self._info_bg, (x_start - 10, y_start - 5))
+        screen.blit(self._context_overlay(terrain_data),
+                    (x_start - 10, y_start - 5))
+        # Les textes partent en un seul fblits (une transition
+        # Python -> C pour tout le lot au lieu d'une par libellé) ;
+        # les chaînes viennent du cache par terrain, sans formatage.
+        terrain_label, grip_label, slope_label, camber_label = (
+            self._labels_for(terrain_data))
+        draws = [
+            (self._render_text(self._context_font, terrain_label,
+                               Colors.WHITE),
+             (x_start + 18, y_start)),
+            (self._render_text(self._small_font, grip_label,
+                               self._grip_color(terrain_data.grip_level)),
+             (x_start, y_start + 22)),
+            (self._render_text(self._small_font, slope_label,
+                               Colors.LIGHT_GRAY),
+             (x_start, y_start + 40)),
+            (self._render_text(self._small_font, camber_label,
+                               Colors.LIGHT_GRAY),
+             (x_start, y_start + 58)),
+        ]
+        # Avertissement clignotant en faible adhérence : l'icône
+        # pré-dessinée part dans le même lot que les textes.
+        if terrain_data.grip_level < 0.4 and self._blink_on:
+            draws.append((self._warning_icon,
+                          (x_start + 170, y_start + 6)))
+        screen.fblits(draws)
@@ -0,0 +1,4 @@
+from utils.colors import Colors
+from utils.vector2 import Vector2, Vector2Array
+
+__all__ = ["Colors", "Vector2", "Vector2Array"]
@@ -0,0 +1,130 @@
+# cython: language_level=3
+"""Vecteur 2D compilé (Cython) : champs double typés, opérateurs en C.
+
+Compilation : ``cythonize -i utils/_vector2_cy.pyx``. L'extension est
+facultative — ``utils.vector2`` l'expose sous ``CompiledVector2`` quand
+elle est présente, et les modules chauds peuvent s'y abonner
+explicitement. L'API réplique celle de ``utils.vector2.Vector2``.
+"""
+
+from libc.math cimport atan2, cos, hypot, sin, sqrt
+
+
+cdef class Vector2:
+    """Vecteur 2D : accès aux champs par chargement de struct, pas de
+    dictionnaire d'instance ni de dispatch Python par opérateur."""
+
+    cdef public double x, y
+
+    def __cinit__(self, double x=0.0, double y=0.0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"Vector2({self.x:.3f}, {self.y:.3f})"
+
+    def __add__(Vector2 self, Vector2 other):
+        return Vector2(self.x + other.x, self.y + other.y)
+
+    def __sub__(Vector2 self, Vector2 other):
+        return Vector2(self.x - other.x, self.y - other.y)
+
+    # Cython 3 ne permute plus les opérandes de __mul__ : la forme
+    # réfléchie (scalaire * vecteur) passe par un vrai __rmul__. Même
+    # garde que la classe pure : vecteur * vecteur n'a pas de sens et
+    # corromprait les composantes.
+    def __mul__(Vector2 self, other):
+        if isinstance(other, Vector2):
+            return NotImplemented
+        return Vector2(self.x * other, self.y * other)
+
+    def __rmul__(Vector2 self, other):
+        if isinstance(other, Vector2):
+            return NotImplemented
+        return Vector2(self.x * other, self.y * other)
+
+    def __truediv__(Vector2 self, double scalar):
+        if scalar == 0.0:
+            raise ValueError("Division d'un Vector2 par zéro")
+        return Vector2(self.x / scalar, self.y / scalar)
+
+    def __neg__(Vector2 self):
+        return Vector2(-self.x, -self.y)
+
+    def __iadd__(Vector2 self, Vector2 other):
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(Vector2 self, Vector2 other):
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(Vector2 self, double scalar):
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __itruediv__(Vector2 self, double scalar):
+        if scalar == 0.0:
+            raise ValueError("Division d'un Vector2 par zéro")
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def __eq__(self, other):
+        if type(other) is not Vector2:
+            return NotImplemented
+        cdef double dx = self.x - (<Vector2>other).x
+        cdef double dy = self.y - (<Vector2>other).y
+        return dx * dx + dy * dy <= 1e-18
+
+    cpdef double length(self):
+        return hypot(self.x, self.y)
+
+    cpdef double length_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    cpdef Vector2 normalize(self):
+        cdef double length_sq = self.x * self.x + self.y * self.y
+        if length_sq == 0.0:
+            raise ValueError("Impossible de normaliser un vecteur nul")
+        cdef double inv = 1.0 / sqrt(length_sq)
+        return Vector2(self.x * inv, self.y * inv)
+
+    cpdef double dot(self, Vector2 other):
+        return self.x * other.x + self.y * other.y
+
+    cpdef double distance_to(self, Vector2 other):
+        return hypot(self.x - other.x, self.y - other.y)
+
+    cpdef double distance_squared_to(self, Vector2 other):
+        cdef double dx = self.x - other.x
+        cdef double dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    cpdef double angle(self):
+        return atan2(self.y, self.x)
+
+    cpdef double angle_to(self, Vector2 other):
+        return atan2(other.y - self.y, other.x - self.x)
+
+    cpdef Vector2 rotate(self, double angle):
+        cdef double cos_a = cos(angle)
+        cdef double sin_a = sin(angle)
+        return Vector2(self.x * cos_a - self.y * sin_a,
+                       self.x * sin_a + self.y * cos_a)
+
+    cpdef Vector2 lerp(self, Vector2 other, double t):
+        return Vector2(self.x + (other.x - self.x) * t,
+                       self.y + (other.y - self.y) * t)
+
+    cpdef Vector2 copy(self):
+        return Vector2(self.x, self.y)
+
+    def to_tuple(self):
+        return (self.x, self.y)
+
+    def to_int_tuple(self):
+        return (int(self.x), int(self.y))
@@ -0,0 +1,14 @@
+"""Palette de couleurs partagée par l'interface."""
+
+
+class Colors:
+    """Constantes RGB nommées (tuples, directement consommables par
+    pygame)."""
+
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    GREEN = (0, 200, 0)
+    YELLOW = (230, 200, 0)
+    RED = (200, 30, 30)
+    DARK_GRAY = (40, 40, 40)
+    LIGHT_GRAY = (180, 180, 180)
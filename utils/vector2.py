@@ -0,0 +1,489 @@
+"""Vecteur 2D pour les positions, vitesses et forces du jeu."""
+
+import functools
+import math
+from numbers import Real as _Real
+
+import numpy as np
+
+try:
+    import simsimd
+except ImportError:  # pragma: no cover - noyaux SIMD optionnels
+    simsimd = None
+
+
+# Liaisons locales au module des fonctions math chaudes : un seul
+# LOAD_GLOBAL au lieu de LOAD_GLOBAL + LOAD_ATTR par appel.
+_sqrt = math.sqrt
+_cos = math.cos
+_sin = math.sin
+_atan2 = math.atan2
+_hypot = math.hypot
+_floor = math.floor
+
+
+@functools.lru_cache(maxsize=256)
+def _sincos(angle_bits: int):
+    """Paire (cos, sin) pour un angle quantifié au 1/1024 de radian.
+
+    Le jeu tourne presque toujours par un petit jeu d'angles discrets
+    (orientations de sprite, crans de direction) : les rotations
+    répétées retombent sur la paire mise en cache au lieu de repayer
+    deux transcendantes."""
+    angle = angle_bits / 1024.0
+    return (_cos(angle), _sin(angle))
+
+
+class Vector2:
+    """Vecteur 2D avec les opérations mathématiques usuelles.
+
+    La classe est slottée : chaque opérateur alloue un vecteur
+    transitoire, et des milliers vivent par frame — deux slots C par
+    instance au lieu d'un __dict__ complet."""
+
+    __slots__ = ('x', 'y')
+
+    # __eq__ est tolérant, le hachage n'aurait pas de sens cohérent.
+    __hash__ = None
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = x
+        self.y = y
+
+    @staticmethod
+    def _make(x: float, y: float) -> 'Vector2':
+        """Fabrique rapide des opérateurs : object.__new__ + deux
+        écritures de slot, sans repasser par le dispatch d'__init__."""
+        v = object.__new__(Vector2)
+        v.x = x
+        v.y = y
+        return v
+
+    def __repr__(self) -> str:
+        return f"Vector2({self.x:.3f}, {self.y:.3f})"
+
+    def __add__(self, other: 'Vector2') -> 'Vector2':
+        return Vector2._make(self.x + other.x, self.y + other.y)
+
+    def __sub__(self, other: 'Vector2') -> 'Vector2':
+        return Vector2._make(self.x - other.x, self.y - other.y)
+
+    def __mul__(self, scalar: float) -> 'Vector2':
+        # Garde numérique : sans elle, v * v délègue self.x * other à
+        # __rmul__ de l'opérande et fabrique un Vector2 corrompu dont
+        # les composantes sont elles-mêmes des Vector2. Le cas courant
+        # (float) ne paie qu'une comparaison de pointeur.
+        if type(scalar) is not float and not isinstance(scalar, _Real):
+            return NotImplemented
+        return Vector2._make(self.x * scalar, self.y * scalar)
+
+    def __rmul__(self, scalar: float) -> 'Vector2':
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: float) -> 'Vector2':
+        if scalar == 0:
+            raise ValueError("Division d'un Vector2 par zéro")
+        return Vector2._make(self.x / scalar, self.y / scalar)
+
+    def __neg__(self) -> 'Vector2':
+        return Vector2._make(-self.x, -self.y)
+
+    # Variantes en place : v += o mute self au lieu d'allouer un
+    # vecteur transitoire par itération de boucle de jeu.
+    def __iadd__(self, other: 'Vector2') -> 'Vector2':
+        self.x += other.x
+        self.y += other.y
+        return self
+
+    def __isub__(self, other: 'Vector2') -> 'Vector2':
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def __imul__(self, scalar: float) -> 'Vector2':
+        self.x *= scalar
+        self.y *= scalar
+        return self
+
+    def __itruediv__(self, scalar: float) -> 'Vector2':
+        if scalar == 0:
+            raise ValueError("Division d'un Vector2 par zéro")
+        self.x /= scalar
+        self.y /= scalar
+        return self
+
+    def __eq__(self, other) -> bool:
+        # Test exact de type (pas d'isinstance) puis une seule
+        # comparaison sur la distance au carré : deux appels à
+        # math.isclose remplacés par quatre multiplications.
+        if type(other) is not Vector2:
+            return NotImplemented
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy <= 1e-18
+
+    def add_scaled(self, other: 'Vector2', scalar: float) -> 'Vector2':
+        """self += other * scalar en place : le pas d'intégrateur
+        canonique sans les deux vecteurs transitoires de
+        `position + velocity * dt`."""
+        self.x += other.x * scalar
+        self.y += other.y * scalar
+        return self
+
+    def length(self) -> float:
+        """Norme du vecteur (hypot : un seul appel C, protégé contre
+        le débordement)."""
+        return _hypot(self.x, self.y)
+
+    def length_squared(self) -> float:
+        """Norme au carré (évite la racine carrée)."""
+        return self.x * self.x + self.y * self.y
+
+    def normalize(self) -> 'Vector2':
+        """Retourne le vecteur unitaire de même direction (une seule
+        division : l'inverse de la norme, puis deux multiplications)."""
+        length_sq = self.x * self.x + self.y * self.y
+        if length_sq == 0.0:
+            raise ValueError("Impossible de normaliser un vecteur nul")
+        inv = 1.0 / _sqrt(length_sq)
+        return Vector2._make(self.x * inv, self.y * inv)
+
+    def normalize_unchecked(self) -> 'Vector2':
+        """Normalisation sans garde : réservée aux appelants qui savent
+        le vecteur non nul (vitesse déjà bornée au-dessus d'un
+        minimum), pas de branche ni de machinerie d'exception."""
+        inv = 1.0 / _sqrt(self.x * self.x + self.y * self.y)
+        return Vector2._make(self.x * inv, self.y * inv)
+
+    def div_unchecked(self, scalar: float) -> 'Vector2':
+        """Division sans test de zéro (invariant garanti à l'appel)."""
+        return Vector2._make(self.x / scalar, self.y / scalar)
+
+    def dot(self, other: 'Vector2') -> float:
+        """Produit scalaire."""
+        return self.x * other.x + self.y * other.y
+
+    def distance_to(self, other: 'Vector2') -> float:
+        """Distance euclidienne vers un autre vecteur.
+
+        Pour une comparaison à un seuil, préférer
+        distance_squared_to ou within_radius : la racine carrée est
+        inutile de part et d'autre de l'inégalité."""
+        return _hypot(self.x - other.x, self.y - other.y)
+
+    def distance_squared_to(self, other: 'Vector2') -> float:
+        """Distance au carré vers un autre vecteur (pour les comparaisons)."""
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def angle(self) -> float:
+        """Angle du vecteur en radians."""
+        return _atan2(self.y, self.x)
+
+    def angle_to(self, other: 'Vector2') -> float:
+        """Angle en radians vers un autre point."""
+        return _atan2(other.y - self.y, other.x - self.x)
+
+    def rotate(self, angle: float) -> 'Vector2':
+        """Retourne le vecteur tourné de `angle` radians (exact : les
+        rotations incrémentales par petits pas ne doivent pas se
+        perdre dans une quantification)."""
+        cos_a = _cos(angle)
+        sin_a = _sin(angle)
+        return Vector2._make(
+            self.x * cos_a - self.y * sin_a,
+            self.x * sin_a + self.y * cos_a,
+        )
+
+    def rotate_snapped(self, angle: float) -> 'Vector2':
+        """Rotation par un angle arrondi au 1/1024 de radian, trig mise
+        en cache : pour les jeux d'angles discrets et répétés (crans
+        d'orientation de sprite), pas pour les intégrations
+        incrémentales."""
+        cos_a, sin_a = _sincos(round(angle * 1024.0))
+        return Vector2._make(
+            self.x * cos_a - self.y * sin_a,
+            self.x * sin_a + self.y * cos_a,
+        )
+
+    def lerp(self, other: 'Vector2', t: float) -> 'Vector2':
+        """Interpolation linéaire entre self et other (t dans [0, 1])."""
+        return Vector2._make(
+            self.x + (other.x - self.x) * t,
+            self.y + (other.y - self.y) * t,
+        )
+
+    def copy(self) -> 'Vector2':
+        return Vector2._make(self.x, self.y)
+
+    def to_tuple(self) -> tuple:
+        return (self.x, self.y)
+
+    def to_int_tuple(self) -> tuple:
+        """Coordonnées entières pour les blits pygame (troncature vers
+        zéro ; préférer to_pixel pour l'espace écran)."""
+        return (int(self.x), int(self.y))
+
+    def to_pixel(self) -> tuple:
+        """Coordonnées pixel par plancher (un appel C par composante) :
+        contrairement à int(), pas de bascule d'arrondi autour de zéro,
+        donc pas d'à-coup d'un pixel en bord de caméra."""
+        return (_floor(self.x), _floor(self.y))
+
+    @staticmethod
+    def to_pixels_array(xy: np.ndarray) -> np.ndarray:
+        """Conversion pixel d'un lot (N, 2) en une passe vectorisée
+        (listes de blits)."""
+        return np.floor(xy).astype(np.int32)
+
+    @staticmethod
+    def angles_from(origin: 'Vector2', xs: np.ndarray,
+                    ys: np.ndarray) -> np.ndarray:
+        """Angles (radians) de `origin` vers N cibles en colonnes : un
+        seul ufunc arctan2 au lieu de N angle_to (IA de peloton,
+        orientation des concurrents)."""
+        return np.arctan2(ys - origin.y, xs - origin.x)
+
+    @staticmethod
+    def batch_l2(query: 'Vector2', points_xy: np.ndarray) -> np.ndarray:
+        """Distances au carré entre `query` et N points ((N, 2)
+        float32) : un noyau SIMD SimSIMD quand il est présent, sinon la
+        soustraction-somme NumPy (ciblage, plus proche concurrent)."""
+        points_xy = np.ascontiguousarray(points_xy, dtype=np.float32)
+        q = np.array([[query.x, query.y]], dtype=np.float32)
+        if simsimd is not None:
+            return np.asarray(
+                simsimd.cdist(q, points_xy, metric='sqeuclidean'))[0]
+        diff = points_xy - q
+        return (diff * diff).sum(axis=1)
+
+    @staticmethod
+    def lerp_many(starts_xy: np.ndarray, ends_xy: np.ndarray,
+                  t: float) -> np.ndarray:
+        """Interpolation linéaire de N paires (tableaux (N, 2)) en une
+        expression vectorisée : un appel C au lieu de N lerp scalaires
+        (tweens d'interface, trajectoires de particules)."""
+        return starts_xy + (ends_xy - starts_xy) * t
+
+    @staticmethod
+    def rotate_many(points_xy: np.ndarray, angle: float) -> np.ndarray:
+        """Rotation de N points (tableau (N, 2)) par un angle commun,
+        trig payée une seule fois puis appliquée par colonnes."""
+        cos_a = _cos(angle)
+        sin_a = _sin(angle)
+        out = np.empty_like(points_xy)
+        out[:, 0] = points_xy[:, 0] * cos_a - points_xy[:, 1] * sin_a
+        out[:, 1] = points_xy[:, 0] * sin_a + points_xy[:, 1] * cos_a
+        return out
+
+    # Les méthodes statiques allouent un vecteur neuf (sans danger à
+    # muter) ; les constantes de classe ZERO/ONE/UP/... en fin de module
+    # sont des singletons partagés en lecture seule par contrat — ne
+    # jamais les muter ni les passer à un consommateur qui mute.
+    @staticmethod
+    def zero() -> 'Vector2':
+        return Vector2(0.0, 0.0)
+
+    @staticmethod
+    def one() -> 'Vector2':
+        return Vector2(1.0, 1.0)
+
+    @staticmethod
+    def up() -> 'Vector2':
+        return Vector2(0.0, -1.0)
+
+    @staticmethod
+    def down() -> 'Vector2':
+        return Vector2(0.0, 1.0)
+
+    @staticmethod
+    def left() -> 'Vector2':
+        return Vector2(-1.0, 0.0)
+
+    @staticmethod
+    def right() -> 'Vector2':
+        return Vector2(1.0, 0.0)
+
+
+try:
+    # Variante Cython (cdef class, champs double typés) : compilée via
+    # `cythonize -i utils/_vector2_cy.pyx`. Les modules chauds peuvent
+    # s'y abonner explicitement ; la classe pure reste le type nominal
+    # du reste du jeu (tests type is, singletons).
+    from utils._vector2_cy import Vector2 as CompiledVector2
+except ImportError:  # pragma: no cover - extension optionnelle
+    CompiledVector2 = None
+
+
+# Singletons en lecture seule : un chargement d'attribut au lieu d'une
+# allocation par appel pour les directions usuelles.
+Vector2.ZERO = Vector2(0.0, 0.0)
+Vector2.ONE = Vector2(1.0, 1.0)
+Vector2.UP = Vector2(0.0, -1.0)
+Vector2.DOWN = Vector2(0.0, 1.0)
+Vector2.LEFT = Vector2(-1.0, 0.0)
+Vector2.RIGHT = Vector2(1.0, 0.0)
+
+
+def within_radius(a: Vector2, b: Vector2, r: float) -> bool:
+    """Vrai si a est à distance <= r de b, sans racine carrée : la
+    comparaison se fait sur les carrés (tests de collision, rayons
+    d'interaction)."""
+    dx = a.x - b.x
+    dy = a.y - b.y
+    return dx * dx + dy * dy <= r * r
+
+
+class Vector2Array:
+    """Lot de vecteurs 2D en SoA (deux colonnes NumPy float32).
+
+    Pour les populations homogènes (particules de boue, projections,
+    concurrents), une opération C sur les colonnes remplace N appels de
+    méthode Vector2 : le coût dominant de ces boucles est le dispatch
+    Python et l'allocation d'un vecteur par opérateur, pas le calcul."""
+
+    __slots__ = ('xs', 'ys')
+
+    def __init__(self, n: int):
+        self.xs = np.zeros(n, dtype=np.float32)
+        self.ys = np.zeros(n, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.xs.shape[0]
+
+    @classmethod
+    def from_vectors(cls, vectors) -> 'Vector2Array':
+        """Construit le lot depuis une séquence de Vector2."""
+        vectors = list(vectors)
+        arr = cls(len(vectors))
+        arr.xs[:] = [v.x for v in vectors]
+        arr.ys[:] = [v.y for v in vectors]
+        return arr
+
+    def get(self, i: int) -> Vector2:
+        """Matérialise l'élément i en Vector2 (chemins froids)."""
+        return Vector2(float(self.xs[i]), float(self.ys[i]))
+
+    def set(self, i: int, vector: Vector2) -> None:
+        self.xs[i] = vector.x
+        self.ys[i] = vector.y
+
+    def add_inplace(self, other: 'Vector2Array') -> None:
+        """self += other, colonne par colonne, sans allocation."""
+        self.xs += other.xs
+        self.ys += other.ys
+
+    def add_scaled_inplace(self, other: 'Vector2Array',
+                           scalar: float) -> None:
+        """self += other * scalar (intégration d'Euler par lot)."""
+        self.xs += other.xs * scalar
+        self.ys += other.ys * scalar
+
+    def scale_inplace(self, scalar: float) -> None:
+        self.xs *= scalar
+        self.ys *= scalar
+
+    def distances_to(self, px: float, py: float) -> np.ndarray:
+        """Distances de chaque élément au point (px, py) : un hypot
+        vectorisé au lieu de N distance_to."""
+        return np.hypot(self.xs - px, self.ys - py)
+
+    def lengths(self) -> np.ndarray:
+        return np.hypot(self.xs, self.ys)
+
+
+class PositionPool:
+    """Réserve contiguë de positions : un tableau partagé (N, 2)
+    float32 dont chaque entité détient une ligne via Vector2View.
+
+    L'inverse du Vector2 autonome : les coordonnées vivent déjà sous
+    forme de tampon, donc les requêtes sur toute la scène (distances,
+    conversions pixel) consomment `data` directement sans
+    re-marshalling, et `row_bytes` expose une ligne au protocole
+    buffer sans conversion par élément."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, n: int):
+        self.data = np.zeros((n, 2), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def view(self, i: int) -> 'Vector2View':
+        """Vue scalaire sur la ligne i (API x/y de Vector2)."""
+        return Vector2View(self.data, i)
+
+    def row_bytes(self, i: int) -> bytes:
+        """Octets bruts de la position i (consommateurs buffer)."""
+        return self.data[i].tobytes()
+
+
+class Vector2View:
+    """Position adossée à une ligne de PositionPool : mêmes accès x/y
+    qu'un Vector2, mais l'écriture atterrit dans le tableau partagé
+    que les chemins vectorisés lisent sans copie."""
+
+    __slots__ = ('_data', '_i')
+
+    def __init__(self, data: np.ndarray, i: int):
+        self._data = data
+        self._i = i
+
+    @property
+    def x(self) -> float:
+        return float(self._data[self._i, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._data[self._i, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._data[self._i, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._data[self._i, 1] = value
+
+    def set_from(self, vector: Vector2) -> None:
+        self._data[self._i, 0] = vector.x
+        self._data[self._i, 1] = vector.y
+
+    def to_vector2(self) -> Vector2:
+        """Copie détachée en Vector2 (chemins froids)."""
+        return Vector2._make(self.x, self.y)
+
+
+class Vector2Cloud:
+    """Nuage de points fixe interrogé de façon répétée (balises du
+    parcours, points de passage).
+
+    Les demi-normes au carré sont précalculées : par l'identité
+    ||p-q||² = p·p + q·q - 2 p·q, chaque requête se réduit à un
+    produit scalaire vectorisé par point au lieu de la forme
+    soustraction-carré-somme."""
+
+    __slots__ = ('xs', 'ys', 'half_sqnorm')
+
+    def __init__(self, points):
+        points = list(points)
+        self.xs = np.array([p.x for p in points], dtype=np.float32)
+        self.ys = np.array([p.y for p in points], dtype=np.float32)
+        self.half_sqnorm = 0.5 * (self.xs * self.xs + self.ys * self.ys)
+
+    def __len__(self) -> int:
+        return self.xs.shape[0]
+
+    def squared_distances_to(self, q: Vector2) -> np.ndarray:
+        """Distances au carré de chaque point du nuage à q."""
+        q_half = 0.5 * (q.x * q.x + q.y * q.y)
+        # dist²/2 = demi-norme(p) + demi-norme(q) - p·q
+        return 2.0 * (self.half_sqnorm + q_half
+                      - (self.xs * q.x + self.ys * q.y))
+
+    def nearest_index(self, q: Vector2) -> int:
+        """Indice du point le plus proche de q (argmin sans sqrt)."""
+        return int(np.argmin(self.half_sqnorm
+                             - (self.xs * q.x + self.ys * q.y)))
@@ -0,0 +1,57 @@
+"""Variante Numba du vecteur 2D, pour les boucles internes compilées.
+
+Quand Numba est présent, `Vector2Jit` est une jitclass : ses méthodes
+s'exécutent en natif et se composent sans boxing avec les fonctions
+`@njit` qui la consomment. Sans Numba, la même classe tourne en pur
+Python — les chemins froids et les tests gardent `utils.vector2.Vector2`.
+"""
+
+import math
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - accélération optionnelle
+    numba = None
+
+
+class Vector2Jit:
+    """Vecteur 2D restreint aux méthodes chaudes, compilable en
+    jitclass (float32, pas de surcharge d'opérateurs)."""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def length(self):
+        return math.sqrt(self.x * self.x + self.y * self.y)
+
+    def length_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    def dot(self, other):
+        return self.x * other.x + self.y * other.y
+
+    def distance_to(self, other):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return math.sqrt(dx * dx + dy * dy)
+
+    def distance_squared_to(self, other):
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def rotate(self, angle):
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        return Vector2Jit(self.x * cos_a - self.y * sin_a,
+                          self.x * sin_a + self.y * cos_a)
+
+    def lerp(self, other, t):
+        return Vector2Jit(self.x + (other.x - self.x) * t,
+                          self.y + (other.y - self.y) * t)
+
+
+if numba is not None:
+    Vector2Jit = numba.experimental.jitclass(
+        [('x', numba.float32), ('y', numba.float32)])(Vector2Jit)